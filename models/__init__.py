@@ -10,7 +10,7 @@ from .job_pool import (
     UnitJobPoolMI,
 )
 from .job_schedule import AbstractJobSchedule, BatchJobSchedule, JobScheduleMI, JobSchedule
-from .schedule import Schedule
+from .schedule import Schedule, UnitSchedule
 
 __all__ = [
     'AbstractJob',
@@ -30,4 +30,5 @@ __all__ = [
     'TimeInterval',
     'UnitJobPool',
     'UnitJobPoolMI',
+    'UnitSchedule',
 ]
@@ -2,7 +2,7 @@
 from abc import ABC
 from functools import total_ordering
 from itertools import count
-from typing import Iterator, List, Optional, Set
+from typing import Iterable, Iterator, List, Optional
 
 
 @total_ordering
@@ -39,31 +39,19 @@ class TimeInterval(object):
         return iter(range(int(self.start), int(self.end) + 1))
 
     @staticmethod
-    def merge_timestamps(timestamps: Set[int]) -> List['TimeInterval']:
+    def merge_timestamps(timestamps: Iterable[int]) -> List['TimeInterval']:
         """
         Merges single timestamps into a list of ordered disjoint time intervals.
         :param timestamps: Timestamps to merge.
         :return: Merged time intervals.
         """
-        if len(timestamps) == 0:
-            return []
-
         time_intervals = []
 
-        min_t = min(timestamps)
-        max_t = max(timestamps)
-
-        time_interval_start = None
-
-        for t in range(min_t, max_t + 1):
-            if time_interval_start is None and t in timestamps:
-                time_interval_start = t
-            if time_interval_start is not None and t not in timestamps:
-                time_intervals.append(TimeInterval(time_interval_start, t - 1))
-                time_interval_start = None
-
-        if time_interval_start is not None:
-            time_intervals.append(TimeInterval(time_interval_start, max_t))
+        for t in sorted(set(timestamps)):
+            if time_intervals and time_intervals[-1].end + 1 == t:
+                time_intervals[-1].end = t
+            else:
+                time_intervals.append(TimeInterval(t, t))
 
         return time_intervals
 
@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
+from numpy import diff, flatnonzero, ndarray, unique
 from typing import List, Optional, Union
 
-from models import AbstractJobSchedule, BatchJobSchedule, TimeInterval
+from models import AbstractJob, AbstractJobSchedule, BatchJobSchedule, Job, JobSchedule, TimeInterval
 
 
 class Schedule(object):
@@ -12,6 +13,8 @@ class Schedule(object):
        variable all_jobs_scheduled is set to False.
     3. Field job_schedules containing the list of individual job (batch) schedules. This field is allowed to be None if
        the variable all_jobs_scheduled is set to False.
+    4. Binary variable interrupted that indicates whether the computation was cut short by a time budget, in which case
+       the schedule is feasible but not as good as the algorithm would produce otherwise.
     """
 
     def __init__(
@@ -19,17 +22,85 @@ class Schedule(object):
             all_jobs_scheduled: bool,
             active_time_intervals: Optional[List[TimeInterval]],
             job_schedules: Union[Optional[List[AbstractJobSchedule]], Optional[List[BatchJobSchedule]]],
+            interrupted: bool = False,
     ) -> None:
         self.all_jobs_scheduled = all_jobs_scheduled
         self.active_time_intervals = active_time_intervals
         self.job_schedules = job_schedules
+        self.interrupted = interrupted
 
     def __str__(self) -> str:
-        return "Schedule(all_jobs_scheduled={0}, active_time_intervals={1}, job_schedules={2})".format(
+        return "Schedule(all_jobs_scheduled={0}, active_time_intervals={1}, job_schedules={2}, interrupted={3})".format(
             self.all_jobs_scheduled,
             self.active_time_intervals,
             self.job_schedules,
+            self.interrupted,
         )
 
     __repr__ = __str__
 
+
+class UnitSchedule(Schedule):
+    """
+    Schedule of unit jobs with a single execution window kept in the array form: the i-th job is executed at the
+    timestamp execution_times[i] if scheduled[i] is set. The active time intervals and the individual job schedules are
+    materialized from the arrays on the first access.
+    """
+
+    def __init__(
+            self,
+            release_times: ndarray,
+            deadlines: ndarray,
+            execution_times: ndarray,
+            scheduled: ndarray,
+            jobs: Optional[List[AbstractJob]] = None,
+    ) -> None:
+        """
+        Initialize the class with parameters.
+        :param release_times: Release times of the jobs.
+        :param deadlines: Deadlines of the jobs.
+        :param execution_times: Execution times of the jobs, ignored for the jobs that are not scheduled.
+        :param scheduled: Flags of the scheduled jobs.
+        :param jobs: Jobs the arrays were created from, None to create the jobs from the arrays when needed.
+        """
+        super(UnitSchedule, self).__init__(bool(scheduled.all()), None, None)
+        self.release_times = release_times
+        self.deadlines = deadlines
+        self.execution_times = execution_times
+        self.scheduled = scheduled
+        self.jobs = jobs
+
+    @property
+    def active_time_intervals(self) -> List[TimeInterval]:
+        if self._active_time_intervals is None:
+            timestamps = unique(self.execution_times[self.scheduled])
+            breaks = flatnonzero(diff(timestamps) != 1)
+
+            starts = timestamps[:1].tolist() + timestamps[breaks + 1].tolist()
+            ends = timestamps[breaks].tolist() + timestamps[-1:].tolist()
+
+            self._active_time_intervals = [TimeInterval(start, end) for start, end in zip(starts, ends)]
+
+        return self._active_time_intervals
+
+    @active_time_intervals.setter
+    def active_time_intervals(self, active_time_intervals: Optional[List[TimeInterval]]) -> None:
+        self._active_time_intervals = active_time_intervals
+
+    @property
+    def job_schedules(self) -> List[JobSchedule]:
+        if self._job_schedules is None:
+            jobs = self.jobs
+            if jobs is None:
+                jobs = [Job(r, d, 1) for r, d in zip(self.release_times.tolist(), self.deadlines.tolist())]
+
+            self._job_schedules = [
+                JobSchedule(jobs[i], t, t)
+                for i, t in zip(flatnonzero(self.scheduled).tolist(), self.execution_times[self.scheduled].tolist())
+            ]
+
+        return self._job_schedules
+
+    @job_schedules.setter
+    def job_schedules(self, job_schedules: Optional[List[JobSchedule]]) -> None:
+        self._job_schedules = job_schedules
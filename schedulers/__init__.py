@@ -6,14 +6,24 @@ from .greedy_scheduler import (
     FlowMethod,
     GreedyLowestDensityFirstScheduler,
     GreedyIntervalsScheduler,
+    GreedyLocalSearchScheduler,
     GreedyScheduler,
     MinFeasScheduler,
 )
 from .brute_force_scheduler import BruteForceScheduler
-from .lazy_activation_scheduler import LazyActivationScheduler, LazyActivationSchedulerNLogN, LazyActivationSchedulerT
+from .lazy_activation_scheduler import (
+    IncrementalLazyActivationScheduler,
+    LazyActivationScheduler,
+    LazyActivationSchedulerAdaptive,
+    LazyActivationSchedulerArrays,
+    LazyActivationSchedulerNLogN,
+    LazyActivationSchedulerT,
+)
 from .linear_programming_scheduler import (
+    IntegerProgrammingScheduler,
     LinearProgrammingMethod,
     LinearProgrammingScheduler,
+    LinearProgrammingSession,
     LinearProgrammingRoundedScheduler,
 )
 from .matching_scheduler import DegreeConstrainedSubgraphScheduler, MatchingScheduler
@@ -27,12 +37,18 @@ __all__ = [
     'FlowMethod',
     'GreedyLowestDensityFirstScheduler',
     'GreedyIntervalsScheduler',
+    'GreedyLocalSearchScheduler',
     'GreedyScheduler',
+    'IncrementalLazyActivationScheduler',
+    'IntegerProgrammingScheduler',
     'LazyActivationScheduler',
+    'LazyActivationSchedulerAdaptive',
+    'LazyActivationSchedulerArrays',
     'LazyActivationSchedulerNLogN',
     'LazyActivationSchedulerT',
     'LinearProgrammingMethod',
     'LinearProgrammingScheduler',
+    'LinearProgrammingSession',
     'LinearProgrammingRoundedScheduler',
     'MatchingScheduler',
     'MinFeasScheduler',
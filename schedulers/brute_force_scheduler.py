@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
-from networkx.algorithms.flow import maximum_flow
 from typing import Dict, List, Set, Tuple, Union
 
 from models import JobMI, JobPool, JobPoolMI, Schedule, TimeInterval
 from schedulers import GreedyScheduler
+from utils import AvailabilityIndex, CapacityBounds
 
 
 class BruteForceScheduler(GreedyScheduler):
@@ -16,17 +16,13 @@ class BruteForceScheduler(GreedyScheduler):
     def _compute_flow(
             self,
             max_concurrency: int,
-            max_t: int,
             jobs: List[JobMI],
+            index: AvailabilityIndex,
             active_timestamps: Set[int],
     ) -> Tuple[int, Dict[int, Dict[int, int]]]:
-        graph = self._create_initial_graph(max_concurrency, max_t, jobs)
+        graph = self._create_segment_graph(max_concurrency, jobs, index, active_timestamps)
 
-        for t in range(max_t):
-            if t in active_timestamps:
-                self._open_time_slot(t, jobs, graph)
-
-        return maximum_flow(graph, 0, 1 + len(jobs) + max_t, flow_func=self.flow_func)  # noqa
+        return self._maximum_flow(graph, 0, 1 + len(jobs) + index.size)
 
     def process(self, job_pool: Union[JobPoolMI, JobPool], max_concurrency: int) -> Schedule:
         """
@@ -44,19 +40,23 @@ class BruteForceScheduler(GreedyScheduler):
         ) + 1
         duration_sum = sum([job.duration for job in job_pool.jobs])
 
+        index = AvailabilityIndex(job_pool.jobs, self.compress_time_slots)
+
         active_timestamps = set()
-        for job in job_pool.jobs:
-            for interval in job.availability_intervals:
-                for t in range(interval.start, interval.end + 1):
-                    active_timestamps.add(t)
+        for segment in index.segments:
+            for t in segment:
+                active_timestamps.add(t)
 
-        flow_value, _ = self._compute_flow(max_concurrency, max_t, job_pool.jobs, active_timestamps)
+        flow_value, _ = self._compute_flow(max_concurrency, job_pool.jobs, index, active_timestamps)
 
         if flow_value != duration_sum:
             return Schedule(False, None, None)
 
         job_schedules = None
 
+        bounds = CapacityBounds(job_pool.jobs, index, max_concurrency, set())
+        previous_bitmask = 0
+
         for bitmask in range(2 ** max_t):
             candidate_active_timestamps = set()
 
@@ -64,16 +64,26 @@ class BruteForceScheduler(GreedyScheduler):
                 if bitmask & (1 << t) != 0:
                     candidate_active_timestamps.add(t)
 
-            if len(candidate_active_timestamps) > len(active_timestamps):
+                if (bitmask ^ previous_bitmask) & (1 << t) != 0:
+                    if bitmask & (1 << t) != 0:
+                        bounds.open(index.jobs_at(t))
+                    else:
+                        bounds.close(index.jobs_at(t))
+
+            previous_bitmask = bitmask
+
+            if len(candidate_active_timestamps) > len(active_timestamps) or bounds.is_satisfied() is False:
                 continue
 
             flow_value, flow_dict = self._compute_flow(
-                max_concurrency, max_t, job_pool.jobs, candidate_active_timestamps
+                max_concurrency, job_pool.jobs, index, candidate_active_timestamps
             )
 
             if flow_value == duration_sum:
                 active_timestamps = candidate_active_timestamps
-                job_schedules = list(self._create_job_schedules(job_pool.jobs, flow_dict))
+                job_schedules = list(
+                    self._create_segment_job_schedules(job_pool.jobs, index, active_timestamps, flow_dict)
+                )
 
         return Schedule(
             True,
@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from itertools import permutations
+from itertools import combinations
+from multiprocessing.sharedctypes import RawArray
 from networkx import DiGraph
 from networkx.algorithms.flow import (
+    build_flow_dict,
     maximum_flow,
     edmonds_karp,
     shortest_augmenting_path,
@@ -11,12 +16,14 @@ from networkx.algorithms.flow import (
     dinitz,
     boykov_kolmogorov,
 )
-from random import shuffle
-from typing import Callable, Dict, Iterable, List, Optional, Set
+from numpy import arange, array, cumsum, int64, lexsort, repeat
+from random import Random
+from time import monotonic
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 from models import Job, JobMI, JobPool, JobScheduleMI, Schedule, TimeInterval
 from schedulers import AbstractScheduler
-from utils import ford_fulkerson
+from utils import ArrayFlowNetwork, AvailabilityIndex, CapacityBounds, IncrementalFlowNetwork, ford_fulkerson
 
 
 class FlowMethod(str, Enum):
@@ -30,20 +37,28 @@ class FlowMethod(str, Enum):
     DINITZ = 'dinitz'
     BOYKOV_KOLMOGOROV = 'boykov_kolmogorov'
     FORD_FULKERSON = 'ford_fulkerson'
+    INCREMENTAL = 'incremental'
+    ARRAY_DINITZ = 'array_dinitz'
+
+
+FlowNetwork = Union[DiGraph, ArrayFlowNetwork, IncrementalFlowNetwork]
 
 
 class AbstractGreedyScheduler(AbstractScheduler, ABC):
     """
     Abstract class for any other greedy scheduler. Defines the constructor, the flow_func property as well as the
-    signature of the process function.
+    signature of the process function. If a time budget is set and it runs out, the schedulers stop closing time slots
+    and return the feasible schedule obtained so far, marked as interrupted.
     """
 
-    def __init__(self, flow_method: FlowMethod = FlowMethod.PREFLOW_PUSH) -> None:
+    def __init__(self, flow_method: FlowMethod = FlowMethod.PREFLOW_PUSH, time_budget: Optional[float] = None) -> None:
         """
         Initialize the class with parameters.
         :param flow_method: Flow method used to solve the feasibility problem.
+        :param time_budget: Time budget of the computation in seconds, None for no limit.
         """
         self.flow_method = flow_method
+        self.time_budget = time_budget
 
     @property
     def flow_func(self) -> Callable:
@@ -56,6 +71,67 @@ class AbstractGreedyScheduler(AbstractScheduler, ABC):
             'ford_fulkerson': ford_fulkerson,
         }[self.flow_method]
 
+    def _get_deadline(self) -> Optional[float]:
+        return None if self.time_budget is None else monotonic() + self.time_budget
+
+    @staticmethod
+    def _is_expired(deadline: Optional[float]) -> bool:
+        return deadline is not None and monotonic() > deadline
+
+    def _create_graph(self) -> FlowNetwork:
+        if self.flow_method == FlowMethod.INCREMENTAL:
+            return IncrementalFlowNetwork()
+        if self.flow_method == FlowMethod.ARRAY_DINITZ:
+            return ArrayFlowNetwork()
+        return DiGraph()
+
+    @staticmethod
+    def _add_capacity(graph: FlowNetwork, u: int, v: int, delta: int) -> None:
+        if isinstance(graph, DiGraph):
+            capacity = graph[u][v]['capacity'] if graph.has_edge(u, v) else 0
+        else:
+            capacity = graph.get_capacity(u, v)
+
+        graph.add_edge(u, v, capacity=capacity + delta)
+
+    def _maximum_flow(self, graph: FlowNetwork, s: int, t: int) -> Tuple[int, Dict[int, Dict[int, int]]]:
+        if not isinstance(graph, DiGraph):
+            return graph.process(s, t), graph.flow_dict()
+        return maximum_flow(graph, s, t, flow_func=self.flow_func)  # noqa
+
+    def _is_feasible(self, graph: FlowNetwork, s: int, t: int, duration_sum: int) -> bool:
+        if not isinstance(graph, DiGraph):
+            return graph.process(s, t) == duration_sum
+
+        residual = self.flow_func(graph, s, t, capacity='capacity', value_only=True)
+        if residual.graph['flow_value'] != duration_sum:
+            return False
+
+        # The residual network keeps the flow of the last feasible network. Only the preflow-push algorithm computes a
+        # mere preflow when asked for the value, which is turned into a flow if the flow is requested.
+        graph.graph['residual'] = None if self.flow_method == FlowMethod.PREFLOW_PUSH else residual
+        return True
+
+    def _get_flow_dict(self, graph: FlowNetwork, s: int, t: int) -> Dict[int, Dict[int, int]]:
+        """
+        Gets the flow of the last feasible network, computed by _is_feasible. No maximum flow is computed here, except
+        for the preflow-push algorithm, which keeps a mere preflow when asked for the value only, so the flow of the
+        last feasible network is computed once more. Computing the flow in every probe would make all the probes
+        slower. The parallel closing of time slots computes the flows in the workers, so it also computes the flow of
+        the resulting network once more.
+        :param graph: Flow network whose last call of _is_feasible succeeded.
+        :param s: Source of the network.
+        :param t: Sink of the network.
+        :return: Flow dictionary of the network.
+        """
+        if not isinstance(graph, DiGraph):
+            return graph.flow_dict()
+
+        if graph.graph['residual'] is None:
+            graph.graph['residual'] = self.flow_func(graph, s, t, capacity='capacity')
+
+        return build_flow_dict(graph, graph.graph['residual'])
+
     @abstractmethod
     def process(self, job_pool: JobPool, max_concurrency: int) -> Schedule:
         """
@@ -72,64 +148,286 @@ class GreedyScheduler(AbstractGreedyScheduler):
     Greedy flow algorithm based on "Brief announcement: A greedy 2 approximation for the active time problem" (Kumar et
     al., 2018). The algorithm computes a 2-approximation solution to a set of jobs with arbitrary lengths but single
     execution interval. The running complexity depends on the selected algorithm used for the maximum flow problem:
-    O(T) flow computations on a network with O(n + T) nodes and O(nT) edges are required to compute the solution.
+    O(T) flow computations on a network with O(n + T) nodes and O(nT) edges are required to compute the solution. If the
+    time slot compression is enabled, consecutive time slots with the same set of available jobs are represented by a
+    single node, which reduces the size of the network to O(n) nodes and O(n^2) edges. If the number of workers is set,
+    the next time slots in the ordering are tried speculatively in parallel processes, which does not change the result.
     """
 
-    @staticmethod
-    def _create_initial_graph(
+    def __init__(
+            self,
+            flow_method: FlowMethod = FlowMethod.PREFLOW_PUSH,
+            compress_time_slots: bool = False,
+            max_workers: Optional[int] = None,
+            time_budget: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the class with parameters.
+        :param flow_method: Flow method used to solve the feasibility problem.
+        :param compress_time_slots: Whether to merge time slots with the same available jobs in the feasibility network.
+        :param max_workers: Number of time slots tried in parallel, None to try the time slots sequentially.
+        :param time_budget: Time budget of the computation in seconds, None for no limit.
+        """
+        super(GreedyScheduler, self).__init__(flow_method, time_budget)
+        self.compress_time_slots = compress_time_slots
+        self.max_workers = max_workers
+
+    def _create_segment_graph(
+            self,
             max_concurrency: int,
-            max_t: int,
             jobs: List[JobMI],
-    ) -> DiGraph:
-        graph = DiGraph()
+            index: AvailabilityIndex,
+            active_timestamps: Optional[Set[int]] = None,
+    ) -> FlowNetwork:
+        graph = self._create_graph()
+        graph.add_node(1 + len(jobs) + index.size)
 
         for i, job in enumerate(jobs):
             u, v = 0, 1 + i
 
             graph.add_edge(u, v, capacity=job.duration)
 
-        for t in range(max_t):
-            u = 1 + len(jobs) + t
-            v = 1 + len(jobs) + max_t
+        for k, segment in enumerate(index.segments):
+            if active_timestamps is None:
+                open_time_slots = segment.duration
+            else:
+                open_time_slots = sum(1 for t in segment if t in active_timestamps)
 
-            graph.add_edge(u, v, capacity=max_concurrency)
+            for i in index.segment_jobs[k]:
+                u = 1 + i
+                v = 1 + len(jobs) + k
+
+                graph.add_edge(u, v, capacity=open_time_slots)
+
+            u = 1 + len(jobs) + k
+            v = 1 + len(jobs) + index.size
+
+            graph.add_edge(u, v, capacity=max_concurrency * open_time_slots)
 
         return graph
 
     @staticmethod
-    def _open_time_slot(t: int, jobs: List[JobMI], graph: DiGraph) -> None:
-        for i, job in enumerate(jobs):
-            for interval in job.availability_intervals:
-                if interval.start <= t <= interval.end:
-                    u = 1 + i
-                    v = 1 + len(jobs) + t
+    def _open_segment_time_slot(
+            t: int,
+            max_concurrency: int,
+            jobs: List[JobMI],
+            index: AvailabilityIndex,
+            graph: FlowNetwork,
+            delta: int = 1,
+    ) -> None:
+        k = index.segment_of(t)
+
+        if k is None:
+            return
+
+        for i in index.segment_jobs[k]:
+            u = 1 + i
+            v = 1 + len(jobs) + k
 
-                    graph.add_edge(u, v, capacity=1)
+            AbstractGreedyScheduler._add_capacity(graph, u, v, delta)
+
+        u = 1 + len(jobs) + k
+        v = 1 + len(jobs) + index.size
+
+        AbstractGreedyScheduler._add_capacity(graph, u, v, max_concurrency * delta)
 
     @staticmethod
-    def _close_time_slot(t: int, jobs: List[JobMI], graph: DiGraph) -> None:
-        for i, job in enumerate(jobs):
-            for interval in job.availability_intervals:
-                if interval.start <= t <= interval.end:
-                    u = 1 + i
-                    v = 1 + len(jobs) + t
+    def _close_segment_time_slot(
+            t: int,
+            max_concurrency: int,
+            jobs: List[JobMI],
+            index: AvailabilityIndex,
+            graph: FlowNetwork,
+    ) -> None:
+        GreedyScheduler._open_segment_time_slot(t, max_concurrency, jobs, index, graph, -1)
 
-                    graph.remove_edge(u, v)
+    def _try_close_time_slot(
+            self,
+            t: int,
+            max_concurrency: int,
+            jobs: List[JobMI],
+            index: AvailabilityIndex,
+            graph: FlowNetwork,
+            bounds: CapacityBounds,
+            duration_sum: int,
+    ) -> bool:
+        if index.segment_of(t) is None:
+            return True
+
+        if bounds.can_close(index.jobs_at(t)) is False:
+            return False
+
+        if not isinstance(graph, DiGraph):
+            graph.checkpoint()
+
+        self._close_segment_time_slot(t, max_concurrency, jobs, index, graph)
+
+        if self._is_feasible(graph, 0, 1 + len(jobs) + index.size, duration_sum) is False:
+            if not isinstance(graph, DiGraph):
+                graph.rollback()
+            else:
+                self._open_segment_time_slot(t, max_concurrency, jobs, index, graph)
+            return False
+
+        if not isinstance(graph, DiGraph):
+            graph.commit()
+
+        bounds.close(index.jobs_at(t))
+
+        return True
+
+    def _close_time_slots(
+            self,
+            t_ordering: List[int],
+            max_concurrency: int,
+            jobs: List[JobMI],
+            index: AvailabilityIndex,
+            graph: FlowNetwork,
+            bounds: CapacityBounds,
+            duration_sum: int,
+            deadline: Optional[float],
+    ) -> Tuple[Set[int], bool]:
+        active_timestamps = set()
+
+        for j, t in enumerate(t_ordering):
+            if self._is_expired(deadline) is True:
+                active_timestamps.update(t for t in t_ordering[j:] if index.segment_of(t) is not None)
+                return active_timestamps, True
+
+            if self._try_close_time_slot(t, max_concurrency, jobs, index, graph, bounds, duration_sum) is False:
+                active_timestamps.add(t)
+
+        return active_timestamps, False
+
+    def _close_time_slots_in_parallel(
+            self,
+            t_ordering: List[int],
+            max_concurrency: int,
+            jobs: List[JobMI],
+            index: AvailabilityIndex,
+            graph: FlowNetwork,
+            bounds: CapacityBounds,
+            duration_sum: int,
+            deadline: Optional[float],
+    ) -> Tuple[Set[int], bool]:
+        # Closing a time slot only removes capacity, so if closing the first j candidates of a batch is infeasible, so
+        # is closing any longer prefix. The workers try the prefixes of the batch, the longest feasible prefix is
+        # closed, the candidate following it stays open, and the rest is tried again in the next batch. The network is
+        # sent to every worker once, the closed time slots are shared through an array that the workers read from the
+        # position they have reached, so a task only carries the number of closed time slots and its prefix.
+        active_timestamps = set()
+        candidates = deque(t for t in t_ordering if index.segment_of(t) is not None)
+        closed_timestamps = RawArray('q', len(candidates))
+        closed_count = 0
+
+        with ProcessPoolExecutor(
+                self.max_workers,
+                initializer=_initialize_worker,
+                initargs=(self, max_concurrency, jobs, index, graph, duration_sum, closed_timestamps),
+        ) as executor:
+            while candidates:
+                if self._is_expired(deadline) is True:
+                    active_timestamps.update(candidates)
+                    return active_timestamps, True
+
+                batch = []
+                while candidates and len(batch) < self.max_workers:
+                    if bounds.can_close(index.jobs_at(candidates[0])) is True:
+                        batch.append(candidates.popleft())
+                        bounds.close(index.jobs_at(batch[-1]))
+                    elif not batch:
+                        active_timestamps.add(candidates.popleft())
+                    else:
+                        break
+
+                for t in batch:
+                    bounds.open(index.jobs_at(t))
+
+                futures = [
+                    executor.submit(_try_close_time_slots, closed_count, tuple(batch[:j + 1]))
+                    for j in range(len(batch))
+                ]
+
+                for j, (t, future) in enumerate(zip(batch, futures)):
+                    if future.result() is False:
+                        active_timestamps.add(t)
+                        candidates.extendleft(reversed(batch[j + 1:]))
+
+                        for other in futures[j + 1:]:
+                            other.cancel()
+                        break
+
+                    self._close_segment_time_slot(t, max_concurrency, jobs, index, graph)
+                    bounds.close(index.jobs_at(t))
+                    closed_timestamps[closed_count] = t
+                    closed_count += 1
+
+        # The time slots were closed without computing the flow of the resulting network.
+        self._is_feasible(graph, 0, 1 + len(jobs) + index.size, duration_sum)
+
+        return active_timestamps, False
 
     @staticmethod
-    def _create_job_schedules(
+    def _get_runs_slice(runs: List[TimeInterval], offsets: List[int], start: int, end: int) -> List[TimeInterval]:
+        time_intervals = []
+        r = bisect_right(offsets, start) - 1
+
+        while start < end:
+            stop = min(end, offsets[r] + runs[r].duration)
+            shift = runs[r].start - offsets[r]
+            time_intervals.append(TimeInterval(start + shift, stop - 1 + shift))
+            start = stop
+            r += 1
+
+        return time_intervals
+
+    @staticmethod
+    def _create_segment_job_schedules(
             jobs: List[JobMI],
+            index: AvailabilityIndex,
+            active_timestamps: Set[int],
             flow_dict: Dict[int, Dict[int, int]],
     ) -> Iterable[JobScheduleMI]:
+        segment_to_timestamps = {}
+        for t in active_timestamps:
+            k = index.segment_of(t)
+            if k is not None:
+                segment_to_timestamps.setdefault(k, [])
+                segment_to_timestamps[k].append(t)
+
+        # The open time slots of every segment are kept as runs of consecutive timestamps, so that the time assigned
+        # to a job is converted into execution intervals without enumerating its timestamps.
+        segment_runs = {}
+        for k, timestamps in segment_to_timestamps.items():
+            runs = TimeInterval.merge_timestamps(timestamps)
+            offsets = [0]
+            for run in runs[:-1]:
+                offsets.append(offsets[-1] + run.duration)
+            segment_runs[k] = (runs, offsets, len(timestamps))
+
+        time_within_segment = dict.fromkeys(segment_runs, 0)
+
         for i, job in enumerate(jobs):
-            job_active_timestamps = set()
+            execution_intervals = []
+
+            for v, scheduled_time in flow_dict[1 + i].items():
+                k = v - 1 - len(jobs)
+                if scheduled_time <= 0 or k not in segment_runs:
+                    continue
+
+                runs, offsets, size = segment_runs[k]
+                start = time_within_segment[k]
+                end = start + scheduled_time
+
+                if end <= size:
+                    execution_intervals += GreedyScheduler._get_runs_slice(runs, offsets, start, end)
+                else:
+                    execution_intervals += GreedyScheduler._get_runs_slice(runs, offsets, start, size)
+                    execution_intervals += GreedyScheduler._get_runs_slice(runs, offsets, 0, end - size)
 
-            for interval in job.availability_intervals:
-                for t in range(interval.start, interval.end + 1):
-                    if flow_dict[1 + i].get(1 + len(jobs) + t, 0) != 0:
-                        job_active_timestamps.add(t)
+                time_within_segment[k] = end % size
 
-            yield JobScheduleMI(job, TimeInterval.merge_timestamps(job_active_timestamps))
+            yield JobScheduleMI(job, TimeInterval.merge_time_intervals(execution_intervals))
 
     def _get_t_ordering(self, job_pool: JobPool) -> List[int]:
         min_t = min([job.release_time for job in job_pool.jobs])
@@ -139,11 +437,13 @@ class GreedyScheduler(AbstractGreedyScheduler):
     def _apply_optimizations(
             self,
             job_pool: JobPool,
-            graph: DiGraph,
+            index: AvailabilityIndex,
+            graph: FlowNetwork,
             active_timestamps: Set[int],
             max_concurrency: int,
-    ) -> None:
-        return
+            deadline: Optional[float],
+    ) -> bool:
+        return True
 
     def process(self, job_pool: JobPool, max_concurrency: int) -> Schedule:
         """
@@ -155,97 +455,255 @@ class GreedyScheduler(AbstractGreedyScheduler):
         if job_pool.size == 0:
             return Schedule(True, [], [])
 
-        max_t = max([job.deadline for job in job_pool.jobs]) + 1
+        deadline = self._get_deadline()
         duration_sum = sum([job.duration for job in job_pool.jobs])
 
-        graph = self._create_initial_graph(max_concurrency, max_t, job_pool.jobs)
+        index = AvailabilityIndex(job_pool.jobs, self.compress_time_slots)
+        graph = self._create_segment_graph(max_concurrency, job_pool.jobs, index)
+        sink = 1 + len(job_pool.jobs) + index.size
 
-        for t in range(max_t):
-            self._open_time_slot(t, job_pool.jobs, graph)
-
-        flow_value, _ = maximum_flow(graph, 0, 1 + len(job_pool.jobs) + max_t, flow_func=self.flow_func)  # noqa
-
-        if flow_value < duration_sum:
+        if self._is_feasible(graph, 0, sink, duration_sum) is False:
             return Schedule(False, None, None)
 
-        active_timestamps = set()
-
-        for t in self._get_t_ordering(job_pool):
-            self._close_time_slot(t, job_pool.jobs, graph)
+        bounds = CapacityBounds(job_pool.jobs, index, max_concurrency)
 
-            flow_value, _ = maximum_flow(graph, 0, 1 + len(job_pool.jobs) + max_t, flow_func=self.flow_func)  # noqa
+        if self.max_workers is None:
+            close_time_slots = self._close_time_slots
+        else:
+            close_time_slots = self._close_time_slots_in_parallel
 
-            if flow_value < duration_sum:
-                self._open_time_slot(t, job_pool.jobs, graph)
-                active_timestamps.add(t)
+        t_ordering = self._get_t_ordering(job_pool)
+        active_timestamps, interrupted = close_time_slots(
+            t_ordering, max_concurrency, job_pool.jobs, index, graph, bounds, duration_sum, deadline,
+        )
 
-        _, flow_dict = maximum_flow(graph, 0, 1 + len(job_pool.jobs) + max_t, flow_func=self.flow_func)  # noqa
+        if interrupted is False:
+            interrupted = not self._apply_optimizations(
+                job_pool, index, graph, active_timestamps, max_concurrency, deadline,
+            )
 
-        self._apply_optimizations(job_pool, graph, active_timestamps, max_concurrency)
+        flow_dict = self._get_flow_dict(graph, 0, sink)
 
         return Schedule(
             True,
             TimeInterval.merge_timestamps(active_timestamps),
-            list(self._create_job_schedules(job_pool.jobs, flow_dict)),
+            list(self._create_segment_job_schedules(job_pool.jobs, index, active_timestamps, flow_dict)),
+            interrupted,
         )
 
 
+_worker_state = {}
+
+
+def _initialize_worker(
+        scheduler: GreedyScheduler,
+        max_concurrency: int,
+        jobs: List[JobMI],
+        index: AvailabilityIndex,
+        graph: FlowNetwork,
+        duration_sum: int,
+        closed_timestamps: Sequence[int],
+) -> None:
+    _worker_state.update(
+        scheduler=scheduler,
+        max_concurrency=max_concurrency,
+        jobs=jobs,
+        index=index,
+        graph=graph,
+        duration_sum=duration_sum,
+        closed_timestamps=closed_timestamps,
+        closed=0,
+    )
+
+
+def _try_close_time_slots(closed_count: int, timestamps: Tuple[int, ...]) -> bool:
+    scheduler = _worker_state['scheduler']
+    max_concurrency = _worker_state['max_concurrency']
+    jobs = _worker_state['jobs']
+    index = _worker_state['index']
+    graph = _worker_state['graph']
+
+    # The closed time slots only grow, so the worker catches up with the ones it has not closed yet.
+    for t in _worker_state['closed_timestamps'][_worker_state['closed']:closed_count]:
+        scheduler._close_segment_time_slot(t, max_concurrency, jobs, index, graph)
+    _worker_state['closed'] = closed_count
+
+    if not isinstance(graph, DiGraph):
+        graph.checkpoint()
+
+    for t in timestamps:
+        scheduler._close_segment_time_slot(t, max_concurrency, jobs, index, graph)
+
+    is_feasible = scheduler._is_feasible(graph, 0, 1 + len(jobs) + index.size, _worker_state['duration_sum'])
+
+    if not isinstance(graph, DiGraph):
+        graph.rollback()
+    else:
+        for t in timestamps:
+            scheduler._open_segment_time_slot(t, max_concurrency, jobs, index, graph)
+
+    return is_feasible
+
+
 class GreedyLocalSearchScheduler(GreedyScheduler):
     """
     The algorithm applies local optimizations to the resulting schedule as described in "Brief announcement: A greedy 2
-    approximation for the active time problem" (Kumar et al., 2018).
+    approximation for the active time problem" (Kumar et al., 2018): B open time slots are closed and B - 1 closed time
+    slots are opened as long as the schedule stays feasible. The open time slots with the most unused capacity and the
+    closed time slots with the most available jobs are tried first, and the search can be limited to a number of
+    candidates on each side as well as to a wall-clock time limit.
     """
 
+    def __init__(
+            self,
+            flow_method: FlowMethod = FlowMethod.PREFLOW_PUSH,
+            compress_time_slots: bool = False,
+            max_workers: Optional[int] = None,
+            neighborhood_size: Optional[int] = None,
+            search_time_limit: Optional[float] = None,
+            time_budget: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the class with parameters.
+        :param flow_method: Flow method used to solve the feasibility problem.
+        :param compress_time_slots: Whether to merge time slots with the same available jobs in the feasibility network.
+        :param max_workers: Number of time slots tried in parallel, None to try the time slots sequentially.
+        :param neighborhood_size: Number of open and closed time slots considered by the local search, None for all.
+        :param search_time_limit: Time limit of the local search in seconds, None for no limit.
+        :param time_budget: Time budget of the computation in seconds, None for no limit.
+        """
+        super(GreedyLocalSearchScheduler, self).__init__(flow_method, compress_time_slots, max_workers, time_budget)
+        self.neighborhood_size = neighborhood_size
+        self.search_time_limit = search_time_limit
+
+    def _get_slack(
+            self,
+            job_pool: JobPool,
+            index: AvailabilityIndex,
+            graph: FlowNetwork,
+            active_timestamps: Set[int],
+            max_concurrency: int,
+    ) -> Dict[int, float]:
+        sink = 1 + len(job_pool.jobs) + index.size
+        flow_dict = self._get_flow_dict(graph, 0, sink)
+
+        segment_to_timestamps = {}
+        for t in active_timestamps:
+            segment_to_timestamps.setdefault(index.segment_of(t), []).append(t)
+
+        slack = {}
+        for k, timestamps in segment_to_timestamps.items():
+            load = flow_dict[1 + len(job_pool.jobs) + k].get(sink, 0) / len(timestamps)
+            for t in timestamps:
+                slack[t] = max_concurrency - load
+
+        return slack
+
+    def _try_move(
+            self,
+            ts_to_close: Tuple[int, ...],
+            ts_to_open: Tuple[int, ...],
+            job_pool: JobPool,
+            index: AvailabilityIndex,
+            graph: FlowNetwork,
+            bounds: CapacityBounds,
+            max_concurrency: int,
+            duration_sum: int,
+    ) -> bool:
+        for t in ts_to_close:
+            bounds.close(index.jobs_at(t))
+        for t in ts_to_open:
+            bounds.open(index.jobs_at(t))
+
+        if bounds.is_satisfied() is True:
+            if not isinstance(graph, DiGraph):
+                graph.checkpoint()
+
+            for t in ts_to_close:
+                self._close_segment_time_slot(t, max_concurrency, job_pool.jobs, index, graph)
+            for t in ts_to_open:
+                self._open_segment_time_slot(t, max_concurrency, job_pool.jobs, index, graph)
+
+            if self._is_feasible(graph, 0, 1 + len(job_pool.jobs) + index.size, duration_sum) is True:
+                if not isinstance(graph, DiGraph):
+                    graph.commit()
+                return True
+
+            if not isinstance(graph, DiGraph):
+                graph.rollback()
+            else:
+                for t in ts_to_open:
+                    self._close_segment_time_slot(t, max_concurrency, job_pool.jobs, index, graph)
+                for t in ts_to_close:
+                    self._open_segment_time_slot(t, max_concurrency, job_pool.jobs, index, graph)
+
+        for t in ts_to_open:
+            bounds.close(index.jobs_at(t))
+        for t in ts_to_close:
+            bounds.open(index.jobs_at(t))
+
+        return False
+
     def _try_close_open(
             self,
             job_pool: JobPool,
-            graph: DiGraph,
+            index: AvailabilityIndex,
+            graph: FlowNetwork,
+            bounds: CapacityBounds,
             active_timestamps: Set[int],
             max_concurrency: int,
+            deadline: Optional[float],
     ) -> bool:
         if len(active_timestamps) < max_concurrency:
             return False
 
-        max_t = max([job.deadline for job in job_pool.jobs]) + 1
         duration_sum = sum([job.duration for job in job_pool.jobs])
+        slack = self._get_slack(job_pool, index, graph, active_timestamps, max_concurrency)
 
-        for ts_to_close in permutations(active_timestamps, max_concurrency):
-            for ts_to_open in permutations(active_timestamps, max_concurrency - 1):
-                ts_to_close = set(ts_to_close).intersection(active_timestamps)
-                ts_to_open = set(ts_to_open).difference(active_timestamps)
+        closed_timestamps = [t for segment in index.segments for t in segment if t not in active_timestamps]
 
-                for t in ts_to_close:
-                    active_timestamps.remove(t)
-                    self._close_time_slot(t, job_pool.jobs, graph)
-                for t in ts_to_open:
-                    active_timestamps.add(t)
-                    self._open_time_slot(t, job_pool.jobs, graph)
+        candidates_to_close = sorted(active_timestamps, key=lambda t: (-slack[t], t))[:self.neighborhood_size]
+        candidates_to_open = sorted(
+            closed_timestamps, key=lambda t: (-len(index.jobs_at(t)), t)
+        )[:self.neighborhood_size]
 
-                flow_value, _ = maximum_flow(graph, 0, 1 + len(job_pool.jobs) + max_t, flow_func=self.flow_func)  # noqa
+        for ts_to_close in combinations(candidates_to_close, max_concurrency):
+            for ts_to_open in combinations(candidates_to_open, max_concurrency - 1):
+                if self._is_expired(deadline) is True:
+                    return False
 
-                if flow_value == duration_sum:
+                if self._try_move(
+                        ts_to_close, ts_to_open, job_pool, index, graph, bounds, max_concurrency, duration_sum,
+                ) is True:
+                    active_timestamps.difference_update(ts_to_close)
+                    active_timestamps.update(ts_to_open)
                     return True
 
-                for t in ts_to_open:
-                    active_timestamps.remove(t)
-                    self._close_time_slot(t, job_pool.jobs, graph)
-                for t in ts_to_close:
-                    active_timestamps.add(t)
-                    self._open_time_slot(t, job_pool.jobs, graph)
-
         return False
 
     def _apply_optimizations(
             self,
             job_pool: JobPool,
-            graph: DiGraph,
+            index: AvailabilityIndex,
+            graph: FlowNetwork,
             active_timestamps: Set[int],
             max_concurrency: int,
-    ) -> None:
+            deadline: Optional[float],
+    ) -> bool:
+        search_deadline = None if self.search_time_limit is None else monotonic() + self.search_time_limit
+        if deadline is not None:
+            search_deadline = deadline if search_deadline is None else min(deadline, search_deadline)
+
+        bounds = CapacityBounds(job_pool.jobs, index, max_concurrency, active_timestamps)
+
         any_improvements = True
 
         while any_improvements is True:
-            any_improvements = self._try_close_open(job_pool, graph, active_timestamps, max_concurrency)
+            any_improvements = self._try_close_open(
+                job_pool, index, graph, bounds, active_timestamps, max_concurrency, search_deadline,
+            )
+
+        return self._is_expired(deadline) is False
 
 
 class GreedyLowestDensityFirstScheduler(GreedyScheduler):
@@ -260,8 +718,13 @@ class GreedyLowestDensityFirstScheduler(GreedyScheduler):
             self,
             flow_method: FlowMethod = FlowMethod.PREFLOW_PUSH,
             f: Optional[Callable[[float], float]] = None,
+            compress_time_slots: bool = False,
+            max_workers: Optional[int] = None,
+            time_budget: Optional[float] = None,
     ) -> None:
-        super(GreedyLowestDensityFirstScheduler, self).__init__(flow_method)
+        super(GreedyLowestDensityFirstScheduler, self).__init__(
+            flow_method, compress_time_slots, max_workers, time_budget,
+        )
         self.f = f
 
     def _get_weight(self, job: Job) -> float:
@@ -271,15 +734,34 @@ class GreedyLowestDensityFirstScheduler(GreedyScheduler):
         return self.f(relative_slack)
 
     def _get_t_ordering(self, job_pool: JobPool) -> List[int]:
-        frequency = {}
-        for job in job_pool.jobs:
-            for t in range(job.release_time, job.deadline + 1):
-                frequency.setdefault(t, 0)
-                frequency[t] += self._get_weight(job)
+        jobs = list(job_pool.jobs)
+        index = AvailabilityIndex(jobs)
+
+        if index.size == 0:
+            return []
+
+        # The density is constant within a segment, so it is summed once per segment. The weights are added in the
+        # order of the jobs, thus the time slots with the same available jobs get exactly the same density and are
+        # ordered by time.
+        if self.f is None:
+            densities = [len(segment_jobs) for segment_jobs in index.segment_jobs]
+        else:
+            weights = [self._get_weight(job) if job.release_time <= job.deadline else 0 for job in jobs]
+            densities = []
+
+            for segment_jobs in index.segment_jobs:
+                density = 0
+                for i in segment_jobs:
+                    density += weights[i]
+                densities.append(density)
+
+        starts = array([segment.start for segment in index.segments], dtype=int64)
+        lengths = array([segment.duration for segment in index.segments], dtype=int64)
 
-        t_ordering = sorted((item[1], item[0]) for item in frequency.items())
+        timestamps = repeat(starts - cumsum(lengths) + lengths, lengths) + arange(lengths.sum())
+        density = repeat(array(densities), lengths)
 
-        return [t for _, t in t_ordering]
+        return timestamps[lexsort((timestamps, density))].tolist()
 
 
 class GreedyIntervalsScheduler(AbstractGreedyScheduler):
@@ -287,14 +769,16 @@ class GreedyIntervalsScheduler(AbstractGreedyScheduler):
     This algorithm computes a 2-approximation solution for jobs with arbitrary lengths and single execution intervals.
     In comparison to GreedyScheduler, this algorithm requires O(nlogT) flow computations on a feasibility network with
     O(n) nodes and O(n^2) edges, which provides a performance boost for the case when T is significantly bigger than n.
+    With the incremental flow method, the flow is carried over between the probes of the binary search and between the
+    intervals, and a failed probe is rolled back instead of being recomputed.
     """
 
-    @staticmethod
     def _create_initial_graph(
+            self,
             intervals: List[TimeInterval],
             jobs: List[Job],
-    ) -> DiGraph:
-        graph = DiGraph()
+    ) -> FlowNetwork:
+        graph = self._create_graph()
 
         for i, job in enumerate(jobs):
             u, v = 0, 1 + i
@@ -314,35 +798,33 @@ class GreedyIntervalsScheduler(AbstractGreedyScheduler):
             jobs: List[Job],
             i: int,
             intervals: List[TimeInterval],
-            graph: DiGraph,
+            index: AvailabilityIndex,
+            graph: FlowNetwork,
             max_concurrency: int,
             delta: int,
     ) -> None:
-        for j, job in enumerate(jobs):
-            if job.release_time <= intervals[i].start and intervals[i].end <= job.deadline:
-                u = 1 + j
-                v = 1 + len(jobs) + i
+        for j in index.jobs_at(intervals[i].start):
+            u = 1 + j
+            v = 1 + len(jobs) + i
 
-                if graph.has_edge(u, v) is False:
-                    graph.add_edge(u, v, capacity=0)
-
-                graph[u][v]['capacity'] += delta
+            AbstractGreedyScheduler._add_capacity(graph, u, v, delta)
 
         u = 1 + len(jobs) + i
         v = 1 + len(jobs) + len(intervals)
 
-        graph[u][v]['capacity'] += max_concurrency * delta
+        AbstractGreedyScheduler._add_capacity(graph, u, v, max_concurrency * delta)
 
     @staticmethod
     def _reduce_interval(
             jobs: List[Job],
             i: int,
             intervals: List[TimeInterval],
-            graph: DiGraph,
+            index: AvailabilityIndex,
+            graph: FlowNetwork,
             max_concurrency: int,
             delta: int,
     ) -> None:
-        GreedyIntervalsScheduler._extend_interval(jobs, i, intervals, graph, max_concurrency, -delta)
+        GreedyIntervalsScheduler._extend_interval(jobs, i, intervals, index, graph, max_concurrency, -delta)
 
     @staticmethod
     def _create_job_schedules(
@@ -385,6 +867,7 @@ class GreedyIntervalsScheduler(AbstractGreedyScheduler):
         if job_pool.size == 0:
             return Schedule(True, [], [])
 
+        deadline = self._get_deadline()
         duration_sum = sum([job.duration for job in job_pool.jobs])
 
         release_time_timestamps = [job.release_time for job in job_pool.jobs]
@@ -395,50 +878,67 @@ class GreedyIntervalsScheduler(AbstractGreedyScheduler):
             TimeInterval(timestamps[i], timestamps[i + 1] - 1) for i in range(len(timestamps) - 1)
         ]
 
+        index = AvailabilityIndex(job_pool.jobs)
         graph = self._create_initial_graph(intervals, job_pool.jobs)
 
         for i, interval in enumerate(intervals):
-            self._extend_interval(job_pool.jobs, i, intervals, graph, max_concurrency, interval.duration)
+            self._extend_interval(job_pool.jobs, i, intervals, index, graph, max_concurrency, interval.duration)
 
-        flow_value, _ = maximum_flow(
-            graph, 0, 1 + len(job_pool.jobs) + len(intervals), flow_func=self.flow_func  # noqa
-        )
+        sink = 1 + len(job_pool.jobs) + len(intervals)
 
-        if flow_value < duration_sum:
+        if self._is_feasible(graph, 0, sink, duration_sum) is False:
             return Schedule(False, None, None)
 
+        bounds = CapacityBounds(job_pool.jobs, index, max_concurrency)
         active_intervals = []
+        interrupted = False
 
         for i in range(len(intervals)):
             left, right = 0, intervals[i].duration + 1
+            job_indices = index.jobs_at(intervals[i].start)
 
             while right - left > 1:
+                if self._is_expired(deadline) is True:
+                    interrupted = True
+                    break
+
                 middle = (left + right) // 2
 
-                self._reduce_interval(job_pool.jobs, i, intervals, graph, max_concurrency, middle)
+                if bounds.can_close(job_indices, middle - left) is False:
+                    right = middle
+                    continue
+
+                # The network stays reduced by the last feasible reduction, so every probe only removes the capacity
+                # between the two reductions, and the incremental flow network re-routes only the displaced flow.
+                if not isinstance(graph, DiGraph):
+                    graph.checkpoint()
 
-                flow_value, _ = maximum_flow(
-                    graph, 0, 1 + len(job_pool.jobs) + len(intervals), flow_func=self.flow_func  # noqa
-                )
+                self._reduce_interval(job_pool.jobs, i, intervals, index, graph, max_concurrency, middle - left)
 
-                if flow_value == duration_sum:
+                if self._is_feasible(graph, 0, sink, duration_sum) is True:
+                    if not isinstance(graph, DiGraph):
+                        graph.commit()
+
+                    bounds.close(job_indices, middle - left)
                     left = middle
                 else:
-                    right = middle
-
-                self._extend_interval(job_pool.jobs, i, intervals, graph, max_concurrency, middle)
+                    if not isinstance(graph, DiGraph):
+                        graph.rollback()
+                    else:
+                        self._extend_interval(job_pool.jobs, i, intervals, index, graph, max_concurrency, middle - left)
 
-            self._reduce_interval(job_pool.jobs, i, intervals, graph, max_concurrency, left)
+                    right = middle
 
             if left != intervals[i].duration:
                 active_intervals.append(TimeInterval(intervals[i].start, intervals[i].end - left))
 
-        _, flow_dict = maximum_flow(graph, 0, 1 + len(job_pool.jobs) + len(intervals), flow_func=self.flow_func)  # noqa
+        flow_dict = self._get_flow_dict(graph, 0, sink)
 
         return Schedule(
             True,
             TimeInterval.merge_time_intervals(active_intervals),
             list(self._create_job_schedules(job_pool.jobs, intervals, flow_dict)),
+            interrupted,
         )
 
 
@@ -446,10 +946,92 @@ class MinFeasScheduler(GreedyScheduler):
     """
     This algorithm was presented in "LP rounding and combinatorial algorithms for minimizing active and busy time"
     (Chang et al., 2017). It provides a 3-approximation to the Active Time Problem by trying to close the time slots in
-    an arbitrary order.
+    an arbitrary order. The order is random, and the algorithm can be restarted several times with different orders,
+    possibly in parallel processes, in which case the schedule with the least active time is returned. The result is
+    deterministic for a fixed seed, unless the time budget runs out.
     """
 
+    def __init__(
+            self,
+            flow_method: FlowMethod = FlowMethod.PREFLOW_PUSH,
+            compress_time_slots: bool = False,
+            time_budget: Optional[float] = None,
+            seed: Optional[int] = None,
+            restarts: int = 1,
+            max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the class with parameters.
+        :param flow_method: Flow method used to solve the feasibility problem.
+        :param compress_time_slots: Whether to merge time slots with the same available jobs in the feasibility network.
+        :param time_budget: Time budget of the whole computation including all the restarts in seconds, None for no
+        limit.
+        :param seed: Seed of the random orders, None for a random seed.
+        :param restarts: Number of random orders to try.
+        :param max_workers: Number of processes the restarts are distributed over, or the number of time slots tried in
+        parallel if there is a single restart, None to compute sequentially.
+        """
+        super(MinFeasScheduler, self).__init__(flow_method, compress_time_slots, max_workers, time_budget)
+        self.seed = seed
+        self.restarts = restarts
+
     def _get_t_ordering(self, job_pool: JobPool) -> List[int]:
-        t_ordering = self._get_t_ordering(job_pool)
-        shuffle(t_ordering)
+        t_ordering = super(MinFeasScheduler, self)._get_t_ordering(job_pool)
+        Random(self.seed).shuffle(t_ordering)
         return t_ordering
+
+    @staticmethod
+    def _get_active_time(schedule: Schedule) -> int:
+        if schedule.all_jobs_scheduled is False:
+            return 0
+        return sum([interval.duration for interval in schedule.active_time_intervals])
+
+    def _process_restart(self, job_pool: JobPool, max_concurrency: int, deadline: Optional[float]) -> Schedule:
+        if deadline is not None:
+            self.time_budget = max(deadline - monotonic(), 0)
+
+        return self.process(job_pool, max_concurrency)
+
+    def process(self, job_pool: JobPool, max_concurrency: int) -> Schedule:
+        """
+        Computes a 3-approximation schedule given a set of jobs and maximum concurrency.
+        :param job_pool: Job pool of jobs with a single execution interval.
+        :param max_concurrency: Maximum number of jobs allowed to run concurrently.
+        :return: Computed schedule.
+        """
+        if self.restarts == 1:
+            return super(MinFeasScheduler, self).process(job_pool, max_concurrency)
+
+        deadline = self._get_deadline()
+
+        random = Random(self.seed)
+        schedulers = [
+            MinFeasScheduler(self.flow_method, self.compress_time_slots, None, random.getrandbits(32))
+            for _ in range(self.restarts)
+        ]
+
+        if self.max_workers is None:
+            schedules = []
+            for scheduler in schedulers:
+                if schedules and self._is_expired(deadline) is True:
+                    break
+                schedules.append(scheduler._process_restart(job_pool, max_concurrency, deadline))
+        else:
+            with ProcessPoolExecutor(self.max_workers) as executor:
+                futures = [
+                    executor.submit(scheduler._process_restart, job_pool, max_concurrency, deadline)
+                    for scheduler in schedulers
+                ]
+                schedules = [future.result() for future in futures]
+
+        schedule = min(schedules, key=self._get_active_time)
+
+        if schedule.all_jobs_scheduled is False:
+            return schedule
+
+        return Schedule(
+            True,
+            schedule.active_time_intervals,
+            schedule.job_schedules,
+            len(schedules) < self.restarts or any(other.interrupted for other in schedules),
+        )
@@ -1,11 +1,16 @@
 # -*- coding: utf-8 -*-
 from abc import ABC, abstractmethod
-from typing import Dict, Iterable, List
+from collections import Counter
+from bisect import bisect_left, bisect_right, insort
+from heapq import heapify, heappop, heappush
+from math import inf
+from numpy import argsort, array, full, int64, ndarray, searchsorted, unique, zeros
+from typing import Dict, Iterable, List, Optional, Tuple
 from queue import PriorityQueue
 
-from models import UnitJobPool, JobSchedule, Schedule, TimeInterval
+from models import Job, UnitJobPool, JobSchedule, Schedule, TimeInterval, UnitSchedule
 from schedulers import AbstractScheduler
-from utils import DisjointSetNode
+from utils import DisjointSet
 
 
 class AbstractLazyActivationScheduler(AbstractScheduler, ABC):
@@ -17,31 +22,72 @@ class AbstractLazyActivationScheduler(AbstractScheduler, ABC):
     """
 
     @staticmethod
-    def _init_for_timestamp(t: int, t_to_count: Dict[int, int], t_to_node: Dict[int, DisjointSetNode]) -> None:
-        if t_to_node.get(t, None) is None:
-            t_to_count[t] = 0
-            t_to_node[t] = DisjointSetNode(t)
+    def _get_candidate_deadlines(max_concurrency: int, deadlines: Iterable[int]) -> List[int]:
+        # The first phase moves a job from its deadline to the latest time slot that is not full, so the time slots
+        # that can be reached are found by stacking the jobs below their deadlines, B per time slot, together with the
+        # time slot right below every stack. The number of such time slots is O(n), independently of the horizon.
+        deadline_to_count = Counter(deadlines)
 
-    @classmethod
+        candidate_deadlines = []
+        pending = 0
+        t = None
+
+        for deadline in sorted(deadline_to_count, reverse=True):
+            while pending > 0 and t > deadline:
+                candidate_deadlines.append(t)
+                pending -= max_concurrency
+                t -= 1
+
+            if pending <= 0:
+                if t is not None:
+                    candidate_deadlines.append(t)
+
+                pending, t = 0, deadline
+
+            pending += deadline_to_count[deadline]
+
+        while pending > 0:
+            candidate_deadlines.append(t)
+            pending -= max_concurrency
+            t -= 1
+
+        if t is not None:
+            candidate_deadlines.append(t)
+
+        return sorted(set(candidate_deadlines))
+
+    @staticmethod
     def _update_deadline_for_job_schedule(
-            cls,
             max_concurrency: int,
             js: JobSchedule,
-            t_to_count: Dict[int, int],
-            t_to_node: Dict[int, DisjointSetNode],
-    ) -> None:
-        cls._init_for_timestamp(js.execution_end, t_to_count, t_to_node)
+            candidate_deadlines: List[int],
+            deadline_to_idx: Dict[int, int],
+            counts: List[int],
+            disjoint_set: DisjointSet,
+    ) -> Iterable[JobSchedule]:
+        k = disjoint_set.find(deadline_to_idx[js.execution_end])
 
-        js.execution_end = t_to_node[js.execution_end].root().value
+        js.execution_end = candidate_deadlines[k]
 
         if js.execution_start <= js.execution_end:
-            t_to_count[js.execution_end] += 1
+            counts[k] += 1
             yield js
 
-        if t_to_count[js.execution_end] == max_concurrency:
-            cls._init_for_timestamp(js.execution_end - 1, t_to_count, t_to_node)
+        if counts[k] == max_concurrency:
+            disjoint_set.union(k, k - 1)
+
+    @classmethod
+    def _get_deadline_adjustment(
+            cls,
+            max_concurrency: int,
+            job_schedules: List[JobSchedule],
+    ) -> Tuple[List[int], Dict[int, int], List[int], DisjointSet]:
+        candidate_deadlines = cls._get_candidate_deadlines(max_concurrency, (js.execution_end for js in job_schedules))
+        deadline_to_idx = {t: k for k, t in enumerate(candidate_deadlines)}
 
-            t_to_node[js.execution_end].unite_with(t_to_node[js.execution_end - 1])
+        counts = [0] * len(candidate_deadlines)
+
+        return candidate_deadlines, deadline_to_idx, counts, DisjointSet(len(candidate_deadlines))
 
     @classmethod
     @abstractmethod
@@ -90,11 +136,10 @@ class LazyActivationSchedulerNLogN(AbstractLazyActivationScheduler):
     def _phase_one(cls, max_concurrency: int, job_schedules: List[JobSchedule]) -> Iterable[JobSchedule]:
         jss_sorted_by_release_time = sorted(job_schedules)
 
-        t_to_count = {}
-        t_to_node = {}
+        adjustment = cls._get_deadline_adjustment(max_concurrency, job_schedules)
 
         for js in reversed(jss_sorted_by_release_time):
-            yield from cls._update_deadline_for_job_schedule(max_concurrency, js, t_to_count, t_to_node)
+            yield from cls._update_deadline_for_job_schedule(max_concurrency, js, *adjustment)
 
     @classmethod
     def _phase_two(cls, max_concurrency: int, job_schedules: List[JobSchedule]) -> Iterable[JobSchedule]:
@@ -169,15 +214,14 @@ class LazyActivationSchedulerT(AbstractLazyActivationScheduler):
             release_time_to_jss.setdefault(js.execution_start, [])
             release_time_to_jss[js.execution_start].append(js)
 
-        t_to_count = {}
-        t_to_node = {}
+        adjustment = cls._get_deadline_adjustment(max_concurrency, job_schedules)
 
         for t in range(max_t - 1, -1, -1):
             if release_time_to_jss.get(t, None) is None:
                 continue
 
             for js in release_time_to_jss[t]:
-                yield from cls._update_deadline_for_job_schedule(max_concurrency, js, t_to_count, t_to_node)
+                yield from cls._update_deadline_for_job_schedule(max_concurrency, js, *adjustment)
 
     @classmethod
     def _phase_two(cls, max_concurrency: int, job_schedules: List[JobSchedule]) -> Iterable[JobSchedule]:
@@ -193,45 +237,37 @@ class LazyActivationSchedulerT(AbstractLazyActivationScheduler):
             deadline_to_jss[js.execution_end].append(js)
 
         release_time_to_idx = {}
-        deadline_to_idx = {}
         deadlines = []
-        t_to_count = {}
-        t_to_node = {}
 
         for t in range(max_t):
             if t in release_time_to_jss:
                 release_time_to_idx[t] = len(deadlines)
             if t in deadline_to_jss:
-                deadline_to_idx[t] = len(deadlines)
-
                 deadlines.append(t)
 
-                t_to_count[t] = 0
-                t_to_node[t] = DisjointSetNode(-t)
+        counts = [0] * len(deadlines)
+        disjoint_set = DisjointSet(len(deadlines))
 
-        for deadline in deadlines:
+        for k, deadline in enumerate(deadlines):
             used = False
 
             for js in deadline_to_jss[deadline]:
-                rounded_release_time = deadlines[release_time_to_idx[js.execution_start]]
+                idx = disjoint_set.find(release_time_to_idx[js.execution_start])
 
-                t = -t_to_node[rounded_release_time].root().value
+                while counts[idx] == max_concurrency:
+                    disjoint_set.union(idx, idx + 1)
+                    idx = disjoint_set.find(idx)
 
-                while t_to_count[t] == max_concurrency:
-                    next_deadline = deadlines[deadline_to_idx[t] + 1]
-                    t_to_node[t].unite_with(t_to_node[next_deadline])
-                    t = -t_to_node[t].root().value
-
-                js.execution_start = js.execution_end = t
+                js.execution_start = js.execution_end = deadlines[idx]
                 yield js
 
-                if t == deadline:
+                if idx == k:
                     used = True
 
-                t_to_count[t] += 1
+                counts[idx] += 1
 
             if used is False:
-                t_to_count[deadline] = max_concurrency
+                counts[k] = max_concurrency
 
     @classmethod
     def _get_active_time_slots(cls, job_schedules: List[JobSchedule]) -> Iterable[TimeInterval]:
@@ -242,4 +278,601 @@ class LazyActivationSchedulerT(AbstractLazyActivationScheduler):
         yield from TimeInterval.merge_timestamps(active_timestamps)
 
 
-LazyActivationScheduler = LazyActivationSchedulerT
+class LazyActivationSchedulerArrays(AbstractScheduler):
+    """
+    The version of the Lazy Activation Algorithm that works on the arrays of release times and deadlines instead of job
+    schedule objects. The jobs are sorted and grouped with NumPy, while both phases are loops over plain integer lists:
+    the first phase uses the array-based disjoint sets over the compressed deadlines, the second phase uses a binary
+    heap. The result is returned as a UnitSchedule, which creates the job schedules only when they are accessed. The
+    running complexity is O(nlogn).
+    """
+
+    @staticmethod
+    def _phase_one(
+            max_concurrency: int,
+            release_times: ndarray,
+            deadlines: ndarray,
+    ) -> Tuple[ndarray, ndarray]:
+        candidate_deadlines = array(
+            AbstractLazyActivationScheduler._get_candidate_deadlines(max_concurrency, deadlines.tolist()), dtype=int64,
+        )
+        deadline_indices = searchsorted(candidate_deadlines, deadlines).tolist()
+        candidate_deadlines = candidate_deadlines.tolist()
+
+        counts = [0] * len(candidate_deadlines)
+        disjoint_set = DisjointSet(len(candidate_deadlines))
+
+        release_times_list = release_times.tolist()
+        adjusted_deadlines = [0] * len(release_times_list)
+        kept = [False] * len(release_times_list)
+
+        for i in argsort(-release_times, kind='stable').tolist():
+            k = disjoint_set.find(deadline_indices[i])
+            t = candidate_deadlines[k]
+
+            if t < release_times_list[i]:
+                continue
+
+            adjusted_deadlines[i] = t
+            kept[i] = True
+
+            counts[k] += 1
+            if counts[k] == max_concurrency:
+                disjoint_set.union(k, k - 1)
+
+        return array(adjusted_deadlines, dtype=int64), array(kept, dtype=bool)
+
+    @staticmethod
+    def _phase_two(
+            max_concurrency: int,
+            release_times: ndarray,
+            deadlines: ndarray,
+            kept: ndarray,
+    ) -> ndarray:
+        execution_times = zeros(release_times.size, dtype=int64)
+
+        jobs = kept.nonzero()[0]
+        jobs_by_deadline = jobs[argsort(deadlines[jobs], kind='stable')]
+        jobs_by_release_time = jobs[argsort(release_times[jobs], kind='stable')].tolist()
+
+        distinct_deadlines, starts, counts = unique(
+            deadlines[jobs_by_deadline], return_index=True, return_counts=True,
+        )
+
+        release_times = release_times.tolist()
+        deadlines = deadlines.tolist()
+        jobs_by_deadline = jobs_by_deadline.tolist()
+
+        used = [False] * len(release_times)
+        available_jobs = []
+        j = 0
+
+        for t, start, count in zip(distinct_deadlines.tolist(), starts.tolist(), counts.tolist()):
+            due_jobs = [i for i in jobs_by_deadline[start:start + count] if used[i] is False]
+            if not due_jobs:
+                continue
+
+            while j < len(jobs_by_release_time) and release_times[jobs_by_release_time[j]] <= t:
+                i = jobs_by_release_time[j]
+                heappush(available_jobs, (deadlines[i], i))
+                j += 1
+
+            for i in due_jobs:
+                used[i] = True
+                execution_times[i] = t
+
+            capacity = max_concurrency - len(due_jobs)
+
+            while capacity > 0 and available_jobs:
+                _, i = heappop(available_jobs)
+                if used[i] is True:
+                    continue
+
+                used[i] = True
+                execution_times[i] = t
+                capacity -= 1
+
+        return execution_times
+
+    @classmethod
+    def process_arrays(cls, release_times: ndarray, deadlines: ndarray, max_concurrency: int) -> UnitSchedule:
+        """
+        Computes the optimal schedule given the release times and deadlines of unit jobs and maximum concurrency.
+        :param release_times: Release times of the jobs.
+        :param deadlines: Deadlines of the jobs.
+        :param max_concurrency: Maximum number of jobs allowed to run concurrently.
+        :return: Computed schedule in the array form.
+        """
+        release_times = array(release_times, dtype=int64)
+        deadlines = array(deadlines, dtype=int64)
+
+        if release_times.size == 0:
+            return UnitSchedule(release_times, deadlines, release_times.copy(), full(0, True))
+
+        adjusted_deadlines, kept = cls._phase_one(max_concurrency, release_times, deadlines)
+        execution_times = cls._phase_two(max_concurrency, release_times, adjusted_deadlines, kept)
+
+        return UnitSchedule(release_times, deadlines, execution_times, kept)
+
+    @classmethod
+    def process(cls, job_pool: UnitJobPool, max_concurrency: int) -> Schedule:
+        """
+        Computes the optimal schedule given a set of jobs and maximum concurrency.
+        :param job_pool: Job pool of jobs with unit length and a single execution interval.
+        :param max_concurrency: Maximum number of jobs allowed to run concurrently.
+        :return: Computed schedule.
+        """
+        jobs = list(job_pool.jobs)
+
+        schedule = cls.process_arrays(
+            [job.release_time for job in jobs],
+            [job.deadline for job in jobs],
+            max_concurrency,
+        )
+        schedule.jobs = jobs
+
+        return schedule
+
+
+class LazyActivationSchedulerAdaptive(AbstractScheduler):
+    """
+    The version of the Lazy Activation Algorithm that chooses the variant based on the number of jobs, the number of
+    distinct deadlines and the span of the timestamps. Large instances are processed by LazyActivationSchedulerArrays,
+    whose setup cost pays off only above a few dozen jobs. Small instances are processed by LazyActivationSchedulerT on
+    the timestamps shifted to start at 0 if the span is dense enough, and on the coordinate-compressed timestamps if it
+    is not, so the running time does not depend on the absolute values of the timestamps.
+    """
+
+    small_instance_size = 32
+    dense_span_factor = 4
+
+    @staticmethod
+    def _get_compressed_timestamps(max_concurrency: int, release_times: List[int], deadlines: List[int]) -> List[int]:
+        # The time slots a job can be moved to in the first phase are kept together with their neighbours, so moving to
+        # the previous compressed timestamp is the same as moving to the previous original timestamp.
+        candidate_deadlines = AbstractLazyActivationScheduler._get_candidate_deadlines(max_concurrency, deadlines)
+
+        return sorted(set(candidate_deadlines).union(release_times))
+
+    @classmethod
+    def process(cls, job_pool: UnitJobPool, max_concurrency: int) -> Schedule:
+        """
+        Computes the optimal schedule given a set of jobs and maximum concurrency.
+        :param job_pool: Job pool of jobs with unit length and a single execution interval.
+        :param max_concurrency: Maximum number of jobs allowed to run concurrently.
+        :return: Computed schedule.
+        """
+        if job_pool.size == 0:
+            return Schedule(True, [], [])
+
+        if job_pool.size > cls.small_instance_size:
+            return LazyActivationSchedulerArrays.process(job_pool, max_concurrency)
+
+        jobs = list(job_pool.jobs)
+        release_times = [job.release_time for job in jobs]
+        deadlines = [job.deadline for job in jobs]
+
+        min_t = min(release_times)
+        span = max(deadlines) - min_t + 1
+
+        if span <= cls.dense_span_factor * (len(jobs) + len(set(deadlines))):
+            timestamps = None
+            job_schedules = [
+                JobSchedule(job, r - min_t, d - min_t) for job, r, d in zip(jobs, release_times, deadlines)
+            ]
+        else:
+            timestamps = cls._get_compressed_timestamps(max_concurrency, release_times, deadlines)
+            t_to_idx = {t: k for k, t in enumerate(timestamps)}
+            job_schedules = [
+                JobSchedule(job, t_to_idx[r], t_to_idx[d]) for job, r, d in zip(jobs, release_times, deadlines)
+            ]
+
+        job_schedules = list(LazyActivationSchedulerT._phase_one(max_concurrency, job_schedules))
+        job_schedules = list(LazyActivationSchedulerT._phase_two(max_concurrency, job_schedules))
+
+        for js in job_schedules:
+            t = js.execution_start + min_t if timestamps is None else timestamps[js.execution_start]
+            js.execution_start = js.execution_end = t
+
+        return Schedule(
+            len(job_schedules) == job_pool.size,
+            TimeInterval.merge_timestamps(js.execution_start for js in job_schedules),
+            job_schedules,
+        )
+
+
+class _IncrementalJobState(object):
+    """
+    State of a job kept by IncrementalLazyActivationScheduler. The jobs are ordered by their release times in the first
+    phase, where ties are broken by the order of addition.
+    """
+
+    __slots__ = ('job', 'release_time', 'deadline', 'seq', 'key', 'adjusted_deadline', 'execution_time')
+
+    def __init__(self, job: Job, seq: int) -> None:
+        """
+        Initialize the class with parameters.
+        :param job: Job with unit length and a single execution interval.
+        :param seq: Position of the job in the order of addition.
+        """
+        self.job = job
+        self.release_time = job.release_time
+        self.deadline = job.deadline
+        self.seq = seq
+        self.key = (job.release_time, -seq, self)
+        self.adjusted_deadline = None
+        self.execution_time = None
+
+
+class IncrementalLazyActivationScheduler(AbstractScheduler):
+    """
+    The version of the Lazy Activation Algorithm that keeps the schedule of a changing set of unit jobs. The result of
+    both phases is kept between the changes: the jobs assigned to every adjusted deadline and the jobs executed at every
+    open time slot. Seen from the latest time slot backwards, the first phase keeps the B jobs with the latest release
+    times at every time slot and pushes the rest one time slot earlier, so adding or removing a job changes the adjusted
+    deadline of at most one job per time slot along a run of full time slots. The second phase is swept again from the
+    earliest release time of a job whose adjusted deadline changed, until the jobs waiting to be executed are the same
+    as before. The job schedules that changed are returned as a delta, and the schedule is the same as the one computed
+    by LazyActivationSchedulerArrays for the jobs in the order of addition.
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None) -> None:
+        """
+        Initialize the class with parameters.
+        :param max_concurrency: Maximum number of jobs allowed to run concurrently, set by process if None.
+        """
+        self.max_concurrency = max_concurrency
+        self._reset()
+
+    def _reset(self) -> None:
+        self._states = {}
+        self._seq = 0
+        self._max_window = 0
+        self._kept = {}
+        self._dropped = []
+        self._release_times = []
+        self._executed = {}
+        self._open_time_slots = []
+
+    def _create_state(self, job: Job) -> _IncrementalJobState:
+        state = _IncrementalJobState(job, self._seq)
+        self._seq += 1
+        self._states[job] = state
+        self._max_window = max(self._max_window, job.deadline - job.release_time)
+
+        return state
+
+    def _keep(self, state: _IncrementalJobState, t: int) -> None:
+        state.adjusted_deadline = t
+        insort(self._kept.setdefault(t, []), state.key)
+
+    def _find_pushed(self, s: int) -> Optional[_IncrementalJobState]:
+        # A job pushed from the time slot s is pushed from every full time slot it passes, so it is assigned within the
+        # run of full time slots below s or right below the run, or it is dropped within the run.
+        best = None
+        u = s - 1
+
+        while True:
+            kept = self._kept.get(u, ())
+
+            for key in reversed(kept):
+                if key[2].deadline >= s:
+                    if best is None or key > best:
+                        best = key
+                    break
+
+            if len(kept) < self.max_concurrency:
+                floor = u
+                break
+
+            # The jobs assigned to earlier time slots are released earlier
+            if best is not None and best[0] >= u:
+                floor = u - 1
+                break
+
+            u -= 1
+
+        i = bisect_right(self._dropped, (s, 1))
+        while i > 0 and self._dropped[i - 1][0] > floor:
+            i -= 1
+            key = self._dropped[i]
+
+            if key[2].deadline >= s:
+                if best is None or key > best:
+                    best = key
+                break
+
+        return None if best is None else best[2]
+
+    def _insert_job(self, state: _IncrementalJobState) -> Dict[_IncrementalJobState, Optional[int]]:
+        changed = {state: None}
+        t = state.deadline
+
+        while True:
+            if state.release_time > t:
+                state.adjusted_deadline = None
+                insort(self._dropped, state.key)
+                break
+
+            kept = self._kept.setdefault(t, [])
+
+            if len(kept) < self.max_concurrency:
+                self._keep(state, t)
+                break
+
+            if state.key > kept[0]:
+                pushed = kept.pop(0)[2]
+                changed.setdefault(pushed, pushed.adjusted_deadline)
+                self._keep(state, t)
+                state = pushed
+
+            t -= 1
+
+        return changed
+
+    def _delete_job(self, state: _IncrementalJobState) -> Dict[_IncrementalJobState, Optional[int]]:
+        changed = {state: state.adjusted_deadline}
+
+        if state.adjusted_deadline is None:
+            self._dropped.remove(state.key)
+            return changed
+
+        s = state.adjusted_deadline
+        is_full = len(self._kept[s]) == self.max_concurrency
+        self._kept[s].remove(state.key)
+        state.adjusted_deadline = None
+
+        # The time slot that lost a job takes back the latest released job pushed from it, which leaves the time slot
+        # of that job with one job less.
+        while is_full is True:
+            pulled = self._find_pushed(s)
+
+            if pulled is None:
+                break
+
+            t = pulled.adjusted_deadline
+            changed.setdefault(pulled, t)
+
+            if t is None:
+                self._dropped.remove(pulled.key)
+                is_full = False
+            else:
+                is_full = len(self._kept[t]) == self.max_concurrency
+                self._kept[t].remove(pulled.key)
+
+            self._keep(pulled, s)
+
+            if t is not None:
+                s = t
+
+        if not self._kept[s]:
+            del self._kept[s]
+
+        return changed
+
+    def _sweep(self, changed: Dict[_IncrementalJobState, Optional[int]]) -> Dict[_IncrementalJobState, int]:
+        def get_old_entry(other: _IncrementalJobState) -> Tuple[int, int, _IncrementalJobState]:
+            return changed.get(other, other.adjusted_deadline), other.seq, other
+
+        changed_release_times = sorted((state.release_time, state.seq, state) for state in changed)
+        t = changed_release_times[0][0]
+        max_release_time = changed_release_times[-1][0]
+
+        # The jobs waiting before the first changed release time are the same as before, and they are executed within
+        # their windows, so only the open time slots within the longest window need to be searched.
+        waiting = []
+        i = bisect_left(self._open_time_slots, t)
+        while i < len(self._open_time_slots) and self._open_time_slots[i] <= t + self._max_window:
+            for other in self._executed[self._open_time_slots[i]]:
+                if other.release_time < t:
+                    waiting.append((other.adjusted_deadline, other.seq, other))
+            i += 1
+        heapify(waiting)
+
+        # The difference maps an entry to 1 if it is waiting only in the new sweep and to -1 if it is waiting only in
+        # the previous one. Once it is empty and no changed job is released later, the sweeps coincide.
+        difference = Counter()
+        execution_times = {}
+
+        release_times = self._release_times
+        open_time_slots = self._open_time_slots
+
+        i_release = bisect_left(release_times, (t,))
+        i_changed = 0
+        i_open = bisect_left(open_time_slots, t)
+
+        next_release_time = release_times[i_release][0] if i_release < len(release_times) else inf
+        next_changed_release_time = changed_release_times[0][0]
+        next_open_time_slot = open_time_slots[i_open] if i_open < len(open_time_slots) else inf
+
+        while True:
+            t = min(next_release_time, next_changed_release_time, next_open_time_slot)
+            if waiting and waiting[0][0] < t:
+                t = waiting[0][0]
+
+            if t == inf:
+                break
+
+            while next_release_time == t:
+                state = release_times[i_release][2]
+                heappush(waiting, (state.adjusted_deadline, state.seq, state))
+                i_release += 1
+                next_release_time = release_times[i_release][0] if i_release < len(release_times) else inf
+
+            while next_changed_release_time == t:
+                state = changed_release_times[i_changed][2]
+                if changed[state] is not None:
+                    difference[get_old_entry(state)] -= 1
+                if state.adjusted_deadline is not None:
+                    difference[(state.adjusted_deadline, state.seq, state)] += 1
+                i_changed += 1
+                next_changed_release_time = (
+                    changed_release_times[i_changed][0] if i_changed < len(changed_release_times) else inf
+                )
+
+            executed = self._executed[t] if next_open_time_slot == t else ()
+            executed_by_both = set()
+
+            if waiting and waiting[0][0] == t:
+                for _ in range(min(self.max_concurrency, len(waiting))):
+                    entry = heappop(waiting)
+                    state = entry[2]
+
+                    # A job executed at the same time slot by both sweeps leaves both of them with the same entry
+                    if state in executed and state not in changed:
+                        executed_by_both.add(state)
+                    else:
+                        execution_times[state] = t
+                        difference[entry] -= 1
+
+            if next_open_time_slot == t:
+                for state in executed:
+                    if state not in executed_by_both:
+                        difference[get_old_entry(state)] += 1
+                i_open += 1
+                next_open_time_slot = open_time_slots[i_open] if i_open < len(open_time_slots) else inf
+
+            if difference:
+                for entry in [entry for entry, count in difference.items() if count == 0]:
+                    del difference[entry]
+
+            if not difference and t >= max_release_time:
+                break
+
+        return execution_times
+
+    def _set_execution_time(self, state: _IncrementalJobState, t: Optional[int]) -> None:
+        if state.execution_time is not None:
+            executed = self._executed[state.execution_time]
+            executed.remove(state)
+
+            if not executed:
+                del self._executed[state.execution_time]
+                self._open_time_slots.pop(bisect_left(self._open_time_slots, state.execution_time))
+
+        if t is not None:
+            if t not in self._executed:
+                self._executed[t] = set()
+                insort(self._open_time_slots, t)
+
+            self._executed[t].add(state)
+
+        state.execution_time = t
+
+    def _update(self, changed: Dict[_IncrementalJobState, Optional[int]]) -> Dict[Job, Optional[JobSchedule]]:
+        changed = {state: t for state, t in changed.items() if state.adjusted_deadline != t}
+
+        for state, t in changed.items():
+            if t is not None:
+                self._release_times.remove((state.release_time, state.seq, state))
+            if state.adjusted_deadline is not None:
+                insort(self._release_times, (state.release_time, state.seq, state))
+
+        delta = {}
+
+        if changed:
+            for state, t in self._sweep(changed).items():
+                if state.execution_time != t:
+                    self._set_execution_time(state, t)
+                    delta[state.job] = JobSchedule(state.job, t, t)
+
+            for state in changed:
+                if state.adjusted_deadline is None and state.execution_time is not None:
+                    self._set_execution_time(state, None)
+                    delta[state.job] = None
+
+        return delta
+
+    def add_job(self, job: Job) -> Dict[Job, Optional[JobSchedule]]:
+        """
+        Adds a job and updates the schedule.
+        :param job: Job with unit length and a single execution interval.
+        :return: New schedules of the jobs whose schedule changed, None for the jobs that are no longer scheduled.
+        """
+        state = self._create_state(job)
+
+        if job.release_time > job.deadline:
+            return {job: None}
+
+        delta = self._update(self._insert_job(state))
+        delta.setdefault(job, None)
+
+        return delta
+
+    def remove_job(self, job: Job) -> Dict[Job, Optional[JobSchedule]]:
+        """
+        Removes a job and updates the schedule.
+        :param job: Previously added job.
+        :return: New schedules of the jobs whose schedule changed, None for the removed job and for the jobs that are no
+        longer scheduled.
+        """
+        state = self._states.pop(job)
+
+        if job.release_time > job.deadline:
+            return {job: None}
+
+        delta = self._update(self._delete_job(state))
+        delta[job] = None
+
+        return delta
+
+    @property
+    def schedule(self) -> Schedule:
+        """
+        Gets the schedule of the current jobs.
+        :return: Current schedule.
+        """
+        job_schedules = [
+            JobSchedule(job, state.execution_time, state.execution_time)
+            for job, state in self._states.items() if state.execution_time is not None
+        ]
+
+        return Schedule(
+            len(job_schedules) == len(self._states),
+            TimeInterval.merge_timestamps(self._open_time_slots),
+            job_schedules,
+        )
+
+    def process(self, job_pool: UnitJobPool, max_concurrency: int) -> Schedule:
+        """
+        Replaces the current jobs with the given ones and computes the optimal schedule.
+        :param job_pool: Job pool of jobs with unit length and a single execution interval.
+        :param max_concurrency: Maximum number of jobs allowed to run concurrently.
+        :return: Computed schedule.
+        """
+        self.max_concurrency = max_concurrency
+        self._reset()
+
+        states = [self._create_state(job) for job in job_pool.jobs]
+        states = [state for state in states if state.release_time <= state.deadline]
+
+        if states:
+            release_times = array([state.release_time for state in states], dtype=int64)
+
+            adjusted_deadlines, kept = LazyActivationSchedulerArrays._phase_one(
+                max_concurrency, release_times, array([state.deadline for state in states], dtype=int64),
+            )
+            execution_times = LazyActivationSchedulerArrays._phase_two(
+                max_concurrency, release_times, adjusted_deadlines, kept,
+            )
+
+            for state, t, is_kept, execution_time in zip(
+                    states, adjusted_deadlines.tolist(), kept.tolist(), execution_times.tolist()
+            ):
+                if is_kept is True:
+                    state.adjusted_deadline = t
+                    self._kept.setdefault(t, []).append(state.key)
+                    self._release_times.append((state.release_time, state.seq, state))
+                    self._set_execution_time(state, execution_time)
+                else:
+                    self._dropped.append(state.key)
+
+            for kept_keys in self._kept.values():
+                kept_keys.sort()
+            self._dropped.sort()
+            self._release_times.sort()
+
+        return self.schedule
+
+
+LazyActivationScheduler = LazyActivationSchedulerAdaptive
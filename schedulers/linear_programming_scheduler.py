@@ -1,14 +1,20 @@
 # -*- coding: utf-8 -*-
+import highspy
 import math
 import warnings
+from bisect import bisect_right
+from collections import deque
 from enum import Enum
-from networkx import maximum_flow
+from numpy import append, arange, array, column_stack, concatenate, float64, full, inf, int64, ndarray, zeros
 from scipy.linalg import LinAlgWarning
-from scipy.optimize import OptimizeResult, OptimizeWarning, linprog
-from typing import Dict, Iterable, List, Tuple, Union
+from scipy.optimize import Bounds, LinearConstraint, OptimizeWarning, linprog, milp
+from scipy.sparse import coo_matrix, csr_matrix, vstack
+from time import monotonic
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 from models import JobMI, JobPool, JobPoolMI, JobScheduleMI, Schedule, TimeInterval
 from schedulers import AbstractScheduler, FlowMethod, GreedyScheduler
+from utils import AvailabilityIndex
 
 
 class LinearProgrammingMethod(str, Enum):
@@ -32,75 +38,116 @@ class LinearProgrammingScheduler(AbstractScheduler):
 
     EPS = 1e-7
 
-    def __init__(self, lp_method: LinearProgrammingMethod = LinearProgrammingMethod.HIGHS) -> None:
+    def __init__(
+            self,
+            lp_method: LinearProgrammingMethod = LinearProgrammingMethod.HIGHS,
+            compress_time_slots: bool = False,
+    ) -> None:
         """
         Initialize the class with parameters.
         :param lp_method: LP method used to solve the LP formulated problem.
+        :param compress_time_slots: Whether to use a single variable for all the time slots with the same available
+        jobs instead of one variable per time slot.
         """
         self.lp_method = lp_method
+        self.compress_time_slots = compress_time_slots
 
     @staticmethod
     def _create_linear_program(
             max_concurrency: int,
             jobs: List[JobMI],
-            var_counter: int,
-            t_to_var: Dict[int, int],
-            js_to_var: Dict[Tuple[int, int], int],
-    ) -> Tuple[List[int], List[List[int]], List[int]]:
-        c = [0] * var_counter
-        for t_var in t_to_var.values():
-            c[t_var] = -1
-
-        A_ub = []
-        b_ub = []
-
-        for job in jobs:
-            A_ub.append([0] * var_counter)
-            b_ub.append(-job.duration)
-
-            for js, js_var in js_to_var.items():
-                if job.id == js[0]:
-                    A_ub[-1][js_var] = -1
-
-        for t, t_var in t_to_var.items():
-            A_ub.append([0] * var_counter)
-            b_ub.append(max_concurrency)
-
-            A_ub[-1][t_var] = max_concurrency
-
-            for js, js_var in js_to_var.items():
-                if t == js[1]:
-                    A_ub[-1][js_var] = 1
-
-        for js, js_var in js_to_var.items():
-            A_ub.append([0] * var_counter)
-            b_ub.append(1)
+            index: AvailabilityIndex,
+    ) -> Tuple[ndarray, csr_matrix, ndarray, ndarray]:
+        # The variable y_k is the closed time of the segment k and the variable x_{j,k} is the processing time of the
+        # job j in the segment k. For segments of a single time slot, this is exactly the LP of (Chang et al., 2012),
+        # longer segments are equivalent to spreading the values evenly over their time slots.
+        lengths = array([segment.duration for segment in index.segments], dtype=float64)
+        number_of_segments = lengths.size
+
+        js_segments = array(
+            [k for k, segment_jobs in enumerate(index.segment_jobs) for _ in segment_jobs], dtype=int64,
+        )
+        js_jobs = array([i for segment_jobs in index.segment_jobs for i in segment_jobs], dtype=int64)
+        js_vars = number_of_segments + arange(js_jobs.size)
+
+        c = zeros(number_of_segments + js_jobs.size)
+        c[:number_of_segments] = -1
+
+        segment_rows_start = len(jobs)
+        pair_rows_start = segment_rows_start + number_of_segments
+        pair_rows = pair_rows_start + arange(js_jobs.size)
+
+        # The rows are, in order: the demand of every job, the capacity of every segment, and the coupling of every
+        # job-segment variable with its segment variable, which cannot be expressed as variable bounds.
+        rows = concatenate((
+            js_jobs,
+            segment_rows_start + js_segments,
+            segment_rows_start + arange(number_of_segments),
+            pair_rows,
+            pair_rows,
+        ))
+        cols = concatenate((js_vars, js_vars, arange(number_of_segments), js_vars, js_segments))
+        values = concatenate((
+            full(js_jobs.size, -1.0),
+            full(js_jobs.size, 1.0),
+            full(number_of_segments, float(max_concurrency)),
+            full(2 * js_jobs.size, 1.0),
+        ))
+
+        A_ub = coo_matrix((values, (rows, cols)), shape=(pair_rows_start + js_jobs.size, c.size)).tocsr()
+        b_ub = concatenate((
+            array([-job.duration for job in jobs], dtype=float64),
+            max_concurrency * lengths,
+            lengths[js_segments],
+        ))
+        upper_bounds = concatenate((lengths, lengths[js_segments]))
+
+        return c, A_ub, b_ub, upper_bounds
+
+    def _solve_linear_program(
+            self,
+            max_concurrency: int,
+            jobs: List[JobMI],
+            index: AvailabilityIndex,
+    ) -> Optional[ndarray]:
+        # Disable precision warnings from old SciPy solvers
+        warnings.simplefilter('ignore', LinAlgWarning)
+        warnings.simplefilter('ignore', OptimizeWarning)
 
-            A_ub[-1][js_var] = 1
+        c, A_ub, b_ub, upper_bounds = self._create_linear_program(max_concurrency, jobs, index)
 
-            _, t = js
+        if self.lp_method not in (
+                LinearProgrammingMethod.HIGHS, LinearProgrammingMethod.HIGHS_DS, LinearProgrammingMethod.HIGHS_IPM,
+        ):
+            # The legacy SciPy solvers do not accept sparse matrices
+            A_ub = A_ub.toarray()
 
-            A_ub[-1][t_to_var[t]] = 1
+        result = linprog(
+            c, A_ub=A_ub, b_ub=b_ub, bounds=column_stack((zeros(c.size), upper_bounds)), method=self.lp_method,
+        )
 
-        return c, A_ub, b_ub
+        return result.x if result.status == 0 else None
 
     def _create_job_schedules(
             self,
             jobs: List[JobMI],
-            js_to_var: Dict[Tuple[int, int], int],
-            optimize_result: OptimizeResult,
+            index: AvailabilityIndex,
+            x: ndarray,
     ) -> Iterable[JobScheduleMI]:
-        for job in jobs:
-            job_schedule = JobScheduleMI(job, [])
+        job_schedules = [JobScheduleMI(job, []) for job in jobs]
+
+        var = index.size
+        for segment, segment_jobs in zip(index.segments, index.segment_jobs):
+            for i in segment_jobs:
+                execution_time = x[var] / segment.duration
+                var += 1
 
-            for interval in job.availability_intervals:
-                for t in range(interval.start, interval.end + 1):
-                    if (job.id, t) in js_to_var and optimize_result.x[js_to_var[(job.id, t)]] > self.EPS:
-                        job_schedule.execution_intervals.append(
-                            TimeInterval(t, t + optimize_result.x[js_to_var[(job.id, t)]])
-                        )
+                if execution_time > self.EPS:
+                    job_schedules[i].execution_intervals.extend(
+                        TimeInterval(t, t + execution_time) for t in segment
+                    )
 
-            yield job_schedule
+        return job_schedules
 
     def process(self, job_pool: Union[JobPoolMI, JobPool], max_concurrency: int) -> Schedule:
         """
@@ -112,58 +159,293 @@ class LinearProgrammingScheduler(AbstractScheduler):
         if job_pool.size == 0:
             return Schedule(True, [], [])
 
-        # Disable precision warnings from old SciPy solvers
-        warnings.simplefilter('ignore', LinAlgWarning)
-        warnings.simplefilter('ignore', OptimizeWarning)
+        jobs = list(job_pool.jobs)
+        index = AvailabilityIndex(jobs, self.compress_time_slots)
+
+        if index.size == 0:
+            return Schedule(True, [], [])
+
+        x = self._solve_linear_program(max_concurrency, jobs, index)
+
+        if x is None:
+            return Schedule(False, None, None)
+
+        # The solution is expanded back to the time slots, the closed time of a segment is spread evenly over them.
+        active_time_intervals = []
+        for k, segment in enumerate(index.segments):
+            closed_time = x[k] / segment.duration
+
+            if 1 - closed_time > self.EPS:
+                active_time_intervals.extend(TimeInterval(t, t + 1 - closed_time) for t in segment)
+
+        return Schedule(
+            True,
+            active_time_intervals,
+            list(self._create_job_schedules(jobs, index, x)),
+        )
+
+
+class LinearProgrammingSession(object):
+    """
+    Keeps the LP of LinearProgrammingScheduler between solves, so that the LP can be re-solved after adding or removing
+    jobs or changing the maximum concurrency. SciPy does not expose a persistent HiGHS model, so the model is kept
+    through highspy and every solve starts from the basis of the previous one. A removed job keeps its variables fixed
+    at 0, so that the basis stays valid, and once the variables of removed jobs make up more than half of the model,
+    the model is rebuilt from the current jobs.
+    """
+
+    EPS = 1e-7
+
+    def __init__(self, max_concurrency: int) -> None:
+        """
+        Initialize the class with parameters.
+        :param max_concurrency: Maximum number of jobs allowed to run concurrently.
+        """
+        self.max_concurrency = max_concurrency
+        self._jobs = {}
+        self._create_model()
+
+    def _create_model(self) -> None:
+        self._highs = highspy.Highs()
+        self._highs.setOptionValue('output_flag', False)
+        self._highs.setOptionValue('presolve', 'off')
+
+        self._t_to_col = {}
+        self._t_to_row = {}
+        self._removed_cols = 0
+
+    def _rebuild_model(self) -> None:
+        jobs = list(self._jobs)
+
+        # The time slots of the removed jobs are dropped as well, the basis of the previous solve is not carried over
+        self._create_model()
+        self._jobs = {}
+        for job in jobs:
+            self.add_job(job)
+
+    def _add_time_slot(self, t: int) -> None:
+        self._t_to_row[t] = self._highs.getNumRow()
+        self._highs.addRow(-highspy.kHighsInf, self.max_concurrency, 0, [], [])
+
+        self._t_to_col[t] = self._highs.getNumCol()
+        self._highs.addCol(-1, 0, 1, 1, [self._t_to_row[t]], [self.max_concurrency])
+
+    def add_job(self, job: JobMI) -> None:
+        """
+        Adds a job to the LP.
+        :param job: Job to add.
+        :return: None
+        """
+        timestamps = sorted({t for interval in job.availability_intervals for t in interval})
+        t_to_col = {}
+
+        for t in timestamps:
+            if t not in self._t_to_col:
+                self._add_time_slot(t)
+
+            t_to_col[t] = self._highs.getNumCol()
+            self._highs.addCol(0, 0, 1, 1, [self._t_to_row[t]], [1])
+            self._highs.addRow(-highspy.kHighsInf, 1, 2, [t_to_col[t], self._t_to_col[t]], [1, 1])
+
+        demand_row = self._highs.getNumRow()
+        self._highs.addRow(
+            job.duration, highspy.kHighsInf, len(t_to_col), list(t_to_col.values()), [1] * len(t_to_col),
+        )
+
+        self._jobs[job] = (demand_row, t_to_col)
 
-        var_counter = 0
+    def remove_job(self, job: JobMI) -> None:
+        """
+        Removes a job from the LP.
+        :param job: Previously added job.
+        :return: None
+        """
+        demand_row, t_to_col = self._jobs.pop(job)
 
-        t_to_var = {}
-        js_to_var = {}
+        # Making the row free instead would discard the warm start in HiGHS
+        self._highs.changeRowBounds(demand_row, 0, highspy.kHighsInf)
+        for col in t_to_col.values():
+            self._highs.changeColBounds(col, 0, 0)
 
-        for job in job_pool.jobs:
-            for interval in job.availability_intervals:
-                for t in range(interval.start, interval.end + 1):
-                    if t not in t_to_var:
-                        t_to_var[t] = var_counter
-                        var_counter += 1
-                    js_to_var[(job.id, t)] = var_counter
-                    var_counter += 1
+        self._removed_cols += len(t_to_col)
+        if 2 * self._removed_cols > self._highs.getNumCol():
+            self._rebuild_model()
+
+    def set_max_concurrency(self, max_concurrency: int) -> None:
+        """
+        Changes the maximum concurrency.
+        :param max_concurrency: Maximum number of jobs allowed to run concurrently.
+        :return: None
+        """
+        self.max_concurrency = max_concurrency
 
-        c, A_ub, b_ub = self._create_linear_program(max_concurrency, job_pool.jobs, var_counter, t_to_var, js_to_var)
+        for t, row in self._t_to_row.items():
+            self._highs.changeCoeff(row, self._t_to_col[t], max_concurrency)
+            self._highs.changeRowBounds(row, -highspy.kHighsInf, max_concurrency)
 
-        if len(c) == 0:
+    def solve(self) -> Schedule:
+        """
+        Solves the LP of the current jobs.
+        :return: Computed schedule with preemption allowed at arbitrary points.
+        """
+        if not self._jobs:
             return Schedule(True, [], [])
 
-        result = linprog(c, A_ub=A_ub, b_ub=b_ub, method=self.lp_method)
+        self._highs.run()
 
-        if result.status != 0:
+        if self._highs.getModelStatus() != highspy.HighsModelStatus.kOptimal:
             return Schedule(False, None, None)
 
-        return Schedule(
-            True,
-            list(sorted(filter(
-                lambda x: x.end - x.start > self.EPS,
-                [TimeInterval(t, t + 1 - result.x[t_var]) for t, t_var in t_to_var.items()]
-            ))),
-            list(self._create_job_schedules(job_pool.jobs, js_to_var, result)),
-        )
+        x = self._highs.getSolution().col_value
+
+        active_time_intervals = [
+            TimeInterval(t, t + 1 - x[col]) for t, col in sorted(self._t_to_col.items()) if 1 - x[col] > self.EPS
+        ]
+
+        job_schedules = []
+        for job, (_, t_to_col) in self._jobs.items():
+            job_schedules.append(JobScheduleMI(job, [
+                TimeInterval(t, t + x[col]) for t, col in t_to_col.items() if x[col] > self.EPS
+            ]))
+
+        return Schedule(True, active_time_intervals, job_schedules)
 
 
 class LinearProgrammingRoundedScheduler(GreedyScheduler):
     """
     Converts the LP solution from LinearProgrammingScheduler to the integer case. The LP rounding scheme used in this
     scheduler was introduced in "LP rounding and combinatorial algorithms for minimizing active and busy time" (Chang et
-    al., 2017).
+    al., 2017). The jobs are assigned to the rounded time slots starting from the integral part of the LP assignment,
+    only the remaining processing time is routed through augmenting paths of the feasibility network.
     """
 
     def __init__(
             self,
             lp_method: LinearProgrammingMethod = LinearProgrammingMethod.HIGHS,
-            flow_method: FlowMethod = FlowMethod.PREFLOW_PUSH,
+            flow_method: Optional[FlowMethod] = None,
+            compress_time_slots: bool = False,
     ) -> None:
-        super(LinearProgrammingRoundedScheduler, self).__init__(flow_method)
-        self.linear_programming_scheduler = LinearProgrammingScheduler(lp_method)
+        """
+        Initialize the class with parameters.
+        :param lp_method: LP method used to solve the LP formulated problem.
+        :param flow_method: Deprecated and ignored, the jobs are assigned to the rounded time slots without computing a
+        maximum flow.
+        :param compress_time_slots: Whether to merge time slots with the same available jobs in the LP and in the
+        feasibility network.
+        """
+        if flow_method is not None:
+            warnings.warn(
+                'flow_method of LinearProgrammingRoundedScheduler is deprecated and ignored', DeprecationWarning, 2,
+            )
+
+        super(LinearProgrammingRoundedScheduler, self).__init__(compress_time_slots=compress_time_slots)
+        self.linear_programming_scheduler = LinearProgrammingScheduler(lp_method, compress_time_slots)
+
+    @staticmethod
+    def _create_assignment(
+            max_concurrency: int,
+            jobs: List[JobMI],
+            index: AvailabilityIndex,
+            open_time_slots: List[int],
+            x: ndarray,
+    ) -> Optional[List[Dict[int, int]]]:
+        job_segments = [[] for _ in jobs]
+        for k, segment_jobs in enumerate(index.segment_jobs):
+            for i in segment_jobs:
+                job_segments[i].append(k)
+
+        assignment = [{} for _ in jobs]
+        remaining = [job.duration for job in jobs]
+        spare = [max_concurrency * count for count in open_time_slots]
+        fractions = [[] for _ in jobs]
+
+        # The integral part of the LP assignment is kept as long as it fits the open time slots of the segment.
+        var = index.size
+        for k, segment_jobs in enumerate(index.segment_jobs):
+            for i in segment_jobs:
+                amount = min(int(x[var] + LinearProgrammingScheduler.EPS), open_time_slots[k], remaining[i], spare[k])
+                var += 1
+
+                if amount > 0:
+                    assignment[i][k] = amount
+                    remaining[i] -= amount
+                    spare[k] -= amount
+
+                fractions[i].append((amount - x[var - 1], k))
+
+        # The rest is first placed directly, preferring the segments where the LP processes the job the most.
+        for i in range(len(jobs)):
+            for _, k in sorted(fractions[i]):
+                if remaining[i] == 0:
+                    break
+
+                amount = min(remaining[i], open_time_slots[k] - assignment[i].get(k, 0), spare[k])
+
+                if amount > 0:
+                    assignment[i][k] = assignment[i].get(k, 0) + amount
+                    remaining[i] -= amount
+                    spare[k] -= amount
+
+        # Only then the feasibility network is searched for augmenting paths from the jobs that are still short, where
+        # a path alternates between the segments that can take more of a job and the jobs already assigned to them.
+        short_jobs = [i for i in range(len(jobs)) if remaining[i] > 0]
+
+        while short_jobs:
+            job_parents = dict.fromkeys(short_jobs)
+            segment_parents = {}
+            queue = deque(short_jobs)
+            target = None
+
+            while queue and target is None:
+                i = queue.popleft()
+
+                for k in job_segments[i]:
+                    if k in segment_parents or assignment[i].get(k, 0) >= open_time_slots[k]:
+                        continue
+
+                    segment_parents[k] = i
+
+                    if spare[k] > 0:
+                        target = k
+                        break
+
+                    for j in index.segment_jobs[k]:
+                        if j not in job_parents and assignment[j].get(k, 0) > 0:
+                            job_parents[j] = k
+                            queue.append(j)
+
+            if target is None:
+                return None
+
+            a = spare[target]
+            k = target
+            while True:
+                i = segment_parents[k]
+                a = min(a, open_time_slots[k] - assignment[i].get(k, 0))
+                k = job_parents[i]
+
+                if k is None:
+                    a = min(a, remaining[i])
+                    break
+
+                a = min(a, assignment[i][k])
+
+            spare[target] -= a
+            k = target
+            while True:
+                i = segment_parents[k]
+                assignment[i][k] = assignment[i].get(k, 0) + a
+                k = job_parents[i]
+
+                if k is None:
+                    remaining[i] -= a
+                    break
+
+                assignment[i][k] -= a
+
+            short_jobs = [i for i in short_jobs if remaining[i] > 0]
+
+        return assignment
 
     def process(self, job_pool: JobPool, max_concurrency: int) -> Schedule:
         """
@@ -172,40 +454,138 @@ class LinearProgrammingRoundedScheduler(GreedyScheduler):
         :param max_concurrency: Maximum number of jobs allowed to run concurrently.
         :return: Computed schedule.
         """
-        schedule = self.linear_programming_scheduler.process(job_pool, max_concurrency)
+        jobs = list(job_pool.jobs)
+        index = AvailabilityIndex(jobs, self.compress_time_slots)
+
+        if index.size == 0:
+            return Schedule(True, [], [JobScheduleMI(job, []) for job in jobs])
 
-        if schedule.all_jobs_scheduled is False:
+        x = self.linear_programming_scheduler._solve_linear_program(max_concurrency, jobs, index)
+
+        if x is None:
             return Schedule(False, None, None)
 
-        deadlines = set([max([interval.end for interval in job.availability_intervals]) + 1 for job in job_pool.jobs])
+        deadlines = sorted(set([max([interval.end for interval in job.availability_intervals]) + 1 for job in jobs]))
+
+        # A segment never contains a deadline, so its open time in the LP counts towards the first deadline after it.
+        duration_sums = [0.0] * len(deadlines)
+        for k, segment in enumerate(index.segments):
+            duration_sums[bisect_right(deadlines, segment.end)] += segment.duration - x[k]
 
-        i = 0
         active_timestamps = set()
+        for deadline, duration_sum in zip(deadlines, duration_sums):
+            active_timestamps.update(
+                range(deadline - 1, deadline - 1 - math.ceil(duration_sum - LinearProgrammingScheduler.EPS), -1)
+            )
 
-        for deadline in sorted(deadlines):
-            duration_sum = 0
+        if len(active_timestamps) == 0:
+            return Schedule(True, [], [JobScheduleMI(job, []) for job in jobs])
 
-            while i < len(schedule.active_time_intervals) and schedule.active_time_intervals[i].end <= deadline:
-                duration_sum += (schedule.active_time_intervals[i].end - schedule.active_time_intervals[i].start)
-                i += 1
+        open_time_slots = [0] * index.size
+        for t in active_timestamps:
+            k = index.segment_of(t)
+            if k is not None:
+                open_time_slots[k] += 1
 
-            for t in range(deadline - 1, deadline - 1 - math.ceil(duration_sum), -1):
-                active_timestamps.add(t)
+        assignment = self._create_assignment(max_concurrency, jobs, index, open_time_slots, x)
 
-        if len(active_timestamps) == 0:
-            return Schedule(True, [], [JobScheduleMI(job, []) for job in job_pool.jobs])
+        if assignment is None:
+            return Schedule(False, None, None)
 
-        max_t = max(active_timestamps) + 1
-        graph = self._create_initial_graph(max_concurrency, max_t, job_pool.jobs)
+        flow_dict = {
+            1 + i: {1 + len(jobs) + k: amount for k, amount in job_assignment.items()}
+            for i, job_assignment in enumerate(assignment)
+        }
 
-        for t in range(max_t):
-            if t in active_timestamps:
-                self._open_time_slot(t, job_pool.jobs, graph)
+        return Schedule(
+            True,
+            TimeInterval.merge_timestamps(active_timestamps),
+            list(self._create_segment_job_schedules(jobs, index, active_timestamps, flow_dict)),
+        )
+
+
+class IntegerProgrammingScheduler(GreedyScheduler):
+    """
+    Computes an optimal solution for the Active Time Problem by solving the LP of LinearProgrammingScheduler with
+    integral closed time with the branch and bound of HiGHS. The schedule of GreedyScheduler is computed first and
+    serves as the incumbent: the optimum has to close at least as many time slots, which is added as a cutoff
+    constraint, and the greedy schedule is returned if no better solution is found within the time budget.
+    """
+
+    def __init__(
+            self,
+            flow_method: FlowMethod = FlowMethod.PREFLOW_PUSH,
+            compress_time_slots: bool = False,
+            time_budget: Optional[float] = None,
+            mip_rel_gap: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the class with parameters.
+        :param flow_method: Flow method used to compute the incumbent and to assign the jobs to the open time slots.
+        :param compress_time_slots: Whether to use a single variable for all the time slots with the same available
+        jobs instead of one variable per time slot.
+        :param time_budget: Time budget of the computation in seconds, None for no limit.
+        :param mip_rel_gap: Relative gap between the solution and the bound at which the search stops, None for the
+        default of HiGHS.
+        """
+        super(IntegerProgrammingScheduler, self).__init__(flow_method, compress_time_slots, time_budget=time_budget)
+        self.mip_rel_gap = mip_rel_gap
+
+    def process(self, job_pool: JobPool, max_concurrency: int) -> Schedule:
+        """
+        Computes the optimal schedule given a set of jobs and maximum concurrency.
+        :param job_pool: Job pool of jobs with a single execution interval.
+        :param max_concurrency: Maximum number of jobs allowed to run concurrently.
+        :return: Computed schedule, marked as interrupted if the optimality was not proven within the time budget.
+        """
+        deadline = self._get_deadline()
+        incumbent = super(IntegerProgrammingScheduler, self).process(job_pool, max_concurrency)
+
+        if incumbent.all_jobs_scheduled is False or job_pool.size == 0:
+            return incumbent
+
+        jobs = list(job_pool.jobs)
+        index = AvailabilityIndex(jobs, self.compress_time_slots)
+
+        c, A_ub, b_ub, upper_bounds = LinearProgrammingScheduler._create_linear_program(max_concurrency, jobs, index)
+
+        # SciPy does not accept an initial solution for MILP, so the objective is bounded by the incumbent instead.
+        closed_time = sum(segment.duration for segment in index.segments) - sum(
+            interval.duration for interval in incumbent.active_time_intervals
+        )
+        A_ub = vstack((A_ub, csr_matrix(c)))
+        b_ub = append(b_ub, -closed_time)
+
+        options = {'disp': False}
+        if deadline is not None:
+            options['time_limit'] = max(deadline - monotonic(), 0)
+        if self.mip_rel_gap is not None:
+            options['mip_rel_gap'] = self.mip_rel_gap
+
+        integrality = zeros(c.size)
+        integrality[:index.size] = 1
+
+        result = milp(
+            c,
+            integrality=integrality,
+            bounds=Bounds(zeros(c.size), upper_bounds),
+            constraints=LinearConstraint(A_ub, -inf, b_ub),
+            options=options,
+        )
+
+        if result.x is None:
+            return Schedule(True, incumbent.active_time_intervals, incumbent.job_schedules, True)
+
+        active_timestamps = set()
+        for k, segment in enumerate(index.segments):
+            active_timestamps.update(range(segment.start, segment.end + 1 - int(round(result.x[k]))))
 
-        _, flow_dict = maximum_flow(graph, 0, 1 + len(job_pool.jobs) + max_t, flow_func=self.flow_func)  # noqa
+        graph = self._create_segment_graph(max_concurrency, jobs, index, active_timestamps)
+        _, flow_dict = self._maximum_flow(graph, 0, 1 + len(jobs) + index.size)
 
         return Schedule(
             True,
             TimeInterval.merge_timestamps(active_timestamps),
-            list(GreedyScheduler._create_job_schedules(job_pool.jobs, flow_dict)),
+            list(self._create_segment_job_schedules(jobs, index, active_timestamps, flow_dict)),
+            result.status != 0 or incumbent.interrupted,
         )
@@ -13,16 +13,16 @@ from models import (
     TimeInterval,
 )
 from schedulers import AbstractScheduler
-from utils import EdmondsBlossomMatching, UpperDegreeConstrainedSubgraph
+from utils import EdmondsBlossomMatching, HopcroftKarpMatching, UpperDegreeConstrainedSubgraph
 
 
 class MatchingScheduler(AbstractScheduler):
     """
     This algorithm is based on the matching algorithm presented in "A model for minimizing active processor time"
     (Chang et al., 2012). Given a set of jobs with unit lengths and arbitrary number of execution intervals, it computes
-    an optimal solution by reducing the Active Time Problem to general matchings. To compute the matching problem, a
-    O(V^3) version of Edmonds' Blossom Algorithm is used. The overall running complexity of the algorithm is therefore
-    O((n + T)^3).
+    an optimal solution by reducing the Active Time Problem to general matchings. The matching of the jobs to the time
+    slots is bipartite and is computed with the Hopcroft-Karp Algorithm. The pairs of free copies of the same time slot
+    are then matched directly, and the remaining augmenting paths are found by Edmonds' Blossom Algorithm.
     """
 
     @staticmethod
@@ -57,12 +57,19 @@ class MatchingScheduler(AbstractScheduler):
                     graph.add_edge(i, job_pool.size + 2 * t)
                     graph.add_edge(i, job_pool.size + 2 * t + 1)
 
-        matching = EdmondsBlossomMatching().process(graph)
+        matching = HopcroftKarpMatching().process(graph, range(job_pool.size))
 
         for i, job in enumerate(job_pool.jobs):
             for interval in job.availability_intervals:
                 for t in range(interval.start, interval.end + 1):
-                    graph.add_edge(job_pool.size + 2 * t, job_pool.size + 2 * t + 1)
+                    u = job_pool.size + 2 * t
+                    v = u + 1
+
+                    graph.add_edge(u, v)
+
+                    if u not in matching and v not in matching:
+                        matching[u] = v
+                        matching[v] = u
 
         matching = EdmondsBlossomMatching().process(graph, initial_matching=matching)
         matching = {(k, v) for k, v in matching.items() if k <= v}
@@ -90,8 +97,10 @@ class DegreeConstrainedSubgraphScheduler(AbstractScheduler):
     """
     This algorithm represents the (upper) degree-constrained-subgraph algorithm developed in "A model for minimizing
     active processor time" (Chang et al., 2012). The DCS problem is reduced to general matchings using the technique
-    from "Another look at the degree constrained subgraph problem" (Shiloach, 1981). To compute the matching itself,
-    a O(V^3) version of Edmonds' Blossom Algorithm is used. The overall complexity of the algorithm is O((nT + L)^3).
+    from "Another look at the degree constrained subgraph problem" (Shiloach, 1981). The first phase assigns the jobs to
+    the time slots, which is a bipartite DCS problem and is solved as a maximum flow with the degree constraints as
+    capacities. Only the second phase, which adds the triangles of the time slots, is reduced to a general matching
+    that is computed by Edmonds' Blossom Algorithm starting from the solution of the first phase.
     """
 
     @staticmethod
@@ -139,8 +148,7 @@ class DegreeConstrainedSubgraphScheduler(AbstractScheduler):
                     constraints[job_pool.size + 3 * t + 1] = 1
                     constraints[job_pool.size + 3 * t + 2] = 1
 
-        h = UpperDegreeConstrainedSubgraph().construct_h(g, constraints)
-        matching = EdmondsBlossomMatching().process(h)
+        dcs = UpperDegreeConstrainedSubgraph().process_bipartite(g, constraints, range(job_pool.size))
 
         for i, job in enumerate(job_pool.jobs):
             for interval in job.availability_intervals:
@@ -149,10 +157,7 @@ class DegreeConstrainedSubgraphScheduler(AbstractScheduler):
                     g.add_edge(job_pool.size + 3 * t + 1, job_pool.size + 3 * t + 2)
                     g.add_edge(job_pool.size + 3 * t + 2, job_pool.size + 3 * t)
 
-        h = UpperDegreeConstrainedSubgraph().construct_h(g, constraints)
-        matching = EdmondsBlossomMatching().process(h, initial_matching=matching)
-
-        dcs = UpperDegreeConstrainedSubgraph().construct_dcs(g, matching)
+        dcs = UpperDegreeConstrainedSubgraph().process(g, constraints, initial_dcs=dcs)
 
         demand = {i: job.duration for i, job in enumerate(job_pool.jobs)}
         active_timestamps = set()
@@ -1,4 +1,4 @@
-from .compare_solutions import check_2_approximation, check_equality
+from .compare_solutions import check_2_approximation, check_3_approximation, check_equality, check_feasibility
 from .generate_jobs import (
     generate_feasible_jobs_normal_distribution,
     generate_feasible_jobs_uniform_distribution,
@@ -10,7 +10,9 @@ from .generate_jobs import (
 
 __all__ = [
     'check_2_approximation',
+    'check_3_approximation',
     'check_equality',
+    'check_feasibility',
     'generate_feasible_jobs_normal_distribution',
     'generate_feasible_jobs_uniform_distribution',
     'generate_feasible_mi_jobs',
@@ -96,3 +96,16 @@ def check_2_approximation(
         max_concurrency: int,
 ) -> None:
     _check_approximation(schedule_a, schedule_b, job_pool, max_concurrency, 2)
+
+
+def check_3_approximation(
+        schedule_a: Schedule,
+        schedule_b: Schedule,
+        job_pool: AbstractJobPool,
+        max_concurrency: int,
+) -> None:
+    _check_approximation(schedule_a, schedule_b, job_pool, max_concurrency, 3)
+
+
+def check_feasibility(schedule: Schedule, job_pool: AbstractJobPool, max_concurrency: int) -> None:
+    _check_feasibility(schedule, job_pool, max_concurrency)
@@ -1,18 +1,29 @@
 # -*- coding: utf-8 -*-
 import pytest
 from numpy.random import randint
-from typing import Type
+from typing import Callable, Optional, Type
 
 from models import JobPool, TimeInterval
+from utils import ArrayFlowNetwork, IncrementalFlowNetwork
 from schedulers import (
     AbstractGreedyScheduler,
     BruteForceScheduler,
     DegreeConstrainedSubgraphScheduler,
+    FlowMethod,
     GreedyIntervalsScheduler,
+    GreedyLocalSearchScheduler,
+    GreedyLowestDensityFirstScheduler,
     GreedyScheduler,
     LazyActivationSchedulerT,
+    MinFeasScheduler,
+)
+from tests.schedulers.common import (
+    check_equality,
+    check_feasibility,
+    check_2_approximation,
+    check_3_approximation,
+    generate_jobs_uniform_distribution,
 )
-from tests.schedulers.common import check_equality, check_2_approximation, generate_jobs_uniform_distribution
 
 
 class TestGreedyScheduler(object):
@@ -77,6 +88,144 @@ class TestGreedyScheduler(object):
 
         check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
 
+    @pytest.mark.repeat(1000)
+    @pytest.mark.parametrize('scheduler', [GreedyIntervalsScheduler, GreedyScheduler])
+    @pytest.mark.parametrize('flow_method', [FlowMethod.ARRAY_DINITZ, FlowMethod.INCREMENTAL])
+    def test_flow_methods(self, scheduler: Type[AbstractGreedyScheduler], flow_method: FlowMethod) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(15, 31)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t * 2 + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        schedule_a = scheduler(FlowMethod.PREFLOW_PUSH).process(job_pool, max_concurrency)
+        schedule_b = scheduler(flow_method).process(job_pool, max_concurrency)
+
+        check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
+        assert schedule_a.active_time_intervals == schedule_b.active_time_intervals
+
+    @pytest.mark.repeat(200)
+    @pytest.mark.parametrize('scheduler', [GreedyIntervalsScheduler, GreedyScheduler])
+    @pytest.mark.parametrize('flow_method', [FlowMethod.ARRAY_DINITZ, FlowMethod.INCREMENTAL])
+    def test_single_flow_per_probe(
+            self,
+            scheduler: Type[AbstractGreedyScheduler],
+            flow_method: FlowMethod,
+            monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(15, 31)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        counts = {'flows': 0, 'probes': 0}
+
+        def count(key: str, method: Callable) -> Callable:
+            def wrapper(*args, **kwargs):
+                counts[key] += 1
+                return method(*args, **kwargs)
+            return wrapper
+
+        for network in [ArrayFlowNetwork, IncrementalFlowNetwork]:
+            monkeypatch.setattr(network, 'process', count('flows', network.process))
+
+        is_feasible = count('probes', AbstractGreedyScheduler._is_feasible)
+        monkeypatch.setattr(AbstractGreedyScheduler, '_is_feasible', is_feasible)
+
+        schedule = scheduler(flow_method).process(job_pool, max_concurrency)
+
+        # The job schedules come from the flow of the last feasible probe, no maximum flow is computed for them.
+        assert counts['probes'] > 0
+        assert counts['flows'] == counts['probes']
+
+        if schedule.all_jobs_scheduled is True:
+            check_feasibility(schedule, job_pool, max_concurrency)
+
+    @pytest.mark.repeat(1000)
+    @pytest.mark.parametrize('scheduler', [GreedyLowestDensityFirstScheduler, GreedyScheduler])
+    def test_compressed_time_slots(self, scheduler: Type[GreedyScheduler]) -> None:
+        max_length = randint(1, 11)
+        max_t = randint(15, 31)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        schedule_a = scheduler().process(job_pool, max_concurrency)
+        schedule_b = scheduler(compress_time_slots=True).process(job_pool, max_concurrency)
+
+        check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
+        assert schedule_a.active_time_intervals == schedule_b.active_time_intervals
+
+    @pytest.mark.repeat(50)
+    @pytest.mark.parametrize('scheduler', [GreedyLowestDensityFirstScheduler, GreedyScheduler])
+    @pytest.mark.parametrize('flow_method', [FlowMethod.PREFLOW_PUSH, FlowMethod.INCREMENTAL, FlowMethod.ARRAY_DINITZ])
+    def test_parallel_time_slot_closing(self, scheduler: Type[GreedyScheduler], flow_method: FlowMethod) -> None:
+        max_length = randint(1, 11)
+        max_t = randint(15, 31)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        schedule_a = scheduler(flow_method).process(job_pool, max_concurrency)
+        schedule_b = scheduler(flow_method, max_workers=4).process(job_pool, max_concurrency)
+
+        check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
+        assert schedule_a.active_time_intervals == schedule_b.active_time_intervals
+
+    @pytest.mark.repeat(20)
+    @pytest.mark.parametrize('compress_time_slots', [False, True])
+    def test_parallel_time_slot_closing_batches(self, compress_time_slots: bool) -> None:
+        max_length = randint(5, 21)
+        max_t = randint(60, 121)
+        max_concurrency = randint(5, 11)
+        number_of_jobs = randint(max_t // 4, max_t // 2 + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        schedule_a = GreedyScheduler(compress_time_slots=compress_time_slots).process(job_pool, max_concurrency)
+        schedule_b = GreedyScheduler(compress_time_slots=compress_time_slots, max_workers=8).process(
+            job_pool, max_concurrency,
+        )
+
+        check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
+        assert schedule_a.active_time_intervals == schedule_b.active_time_intervals
+
+    @pytest.mark.repeat(1000)
+    @pytest.mark.parametrize('scheduler', [
+        GreedyIntervalsScheduler,
+        GreedyLocalSearchScheduler,
+        GreedyLowestDensityFirstScheduler,
+        GreedyScheduler,
+    ])
+    @pytest.mark.parametrize('time_budget', [0, 60])
+    def test_time_budget(self, scheduler: Type[AbstractGreedyScheduler], time_budget: float) -> None:
+        max_length = randint(1, 11)
+        max_t = randint(15, 31)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        schedule_a = scheduler().process(job_pool, max_concurrency)
+        schedule_b = scheduler(time_budget=time_budget).process(job_pool, max_concurrency)
+
+        assert schedule_a.all_jobs_scheduled == schedule_b.all_jobs_scheduled
+        assert schedule_a.interrupted is False
+
+        if schedule_b.all_jobs_scheduled is True:
+            check_feasibility(schedule_b, job_pool, max_concurrency)
+
+            if time_budget == 0:
+                assert schedule_b.interrupted is True
+            else:
+                assert schedule_b.interrupted is False
+                assert schedule_a.active_time_intervals == schedule_b.active_time_intervals
+
     @pytest.mark.repeat(1000)
     @pytest.mark.parametrize('scheduler_b', [GreedyIntervalsScheduler, GreedyScheduler])
     def test_against_brute_force(self, scheduler_b: Type[AbstractGreedyScheduler]) -> None:
@@ -92,6 +241,114 @@ class TestGreedyScheduler(object):
 
         check_2_approximation(schedule_a, schedule_b, job_pool, max_concurrency)
 
+    @pytest.mark.repeat(1000)
+    @pytest.mark.parametrize('f', [None, lambda x: 1 / (1 + x), lambda x: x ** 0.5])
+    def test_lowest_density_first_weights(self, f: Optional[Callable[[float], float]]) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(4, 9)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+        scheduler = GreedyLowestDensityFirstScheduler(f=f)
+
+        density = {}
+        for job in job_pool.jobs:
+            for t in range(job.release_time, job.deadline + 1):
+                density[t] = density.get(t, 0) + scheduler._get_weight(job)  # noqa
+
+        assert scheduler._get_t_ordering(job_pool) == sorted(density, key=lambda t: (density[t], t))  # noqa
+
+        schedule_a = BruteForceScheduler().process(job_pool, max_concurrency)
+        schedule_b = scheduler.process(job_pool, max_concurrency)
+
+        check_3_approximation(schedule_a, schedule_b, job_pool, max_concurrency)
+
+    @pytest.mark.repeat(1000)
+    @pytest.mark.parametrize('flow_method', [FlowMethod.PREFLOW_PUSH, FlowMethod.INCREMENTAL])
+    @pytest.mark.parametrize('neighborhood_size', [None, 4])
+    def test_local_search(self, flow_method: FlowMethod, neighborhood_size: int) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(4, 9)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        schedule_a = BruteForceScheduler().process(job_pool, max_concurrency)
+        schedule_b = GreedyScheduler(flow_method).process(job_pool, max_concurrency)
+        schedule_c = GreedyLocalSearchScheduler(flow_method, neighborhood_size=neighborhood_size).process(
+            job_pool, max_concurrency
+        )
+
+        check_2_approximation(schedule_a, schedule_c, job_pool, max_concurrency)
+
+        if schedule_a.all_jobs_scheduled is True:
+            active_time_a = sum(interval.duration for interval in schedule_a.active_time_intervals)
+            active_time_b = sum(interval.duration for interval in schedule_b.active_time_intervals)
+            active_time_c = sum(interval.duration for interval in schedule_c.active_time_intervals)
+
+            assert active_time_a <= active_time_c <= active_time_b
+
+    @pytest.mark.repeat(1000)
+    @pytest.mark.parametrize('restarts', [1, 3])
+    def test_min_feas_against_brute_force(self, restarts: int) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(4, 9)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        schedule_a = BruteForceScheduler().process(job_pool, max_concurrency)
+        schedule_b = MinFeasScheduler(restarts=restarts).process(job_pool, max_concurrency)
+
+        check_3_approximation(schedule_a, schedule_b, job_pool, max_concurrency)
+
+    @pytest.mark.repeat(50)
+    def test_min_feas_restarts(self) -> None:
+        max_length = randint(1, 11)
+        max_t = randint(15, 31)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t + 1)
+        seed = randint(0, 1000)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        schedule_a = MinFeasScheduler(seed=seed, restarts=4).process(job_pool, max_concurrency)
+        schedule_b = MinFeasScheduler(seed=seed, restarts=4, max_workers=2).process(job_pool, max_concurrency)
+        schedule_c = MinFeasScheduler(seed=seed, restarts=8).process(job_pool, max_concurrency)
+
+        check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
+        assert schedule_a.active_time_intervals == schedule_b.active_time_intervals
+
+        if schedule_a.all_jobs_scheduled is True:
+            active_time_a = sum(interval.duration for interval in schedule_a.active_time_intervals)
+            active_time_c = sum(interval.duration for interval in schedule_c.active_time_intervals)
+
+            assert active_time_c <= active_time_a
+
+    @pytest.mark.repeat(50)
+    @pytest.mark.parametrize('max_workers', [None, 2])
+    def test_min_feas_time_budget(self, max_workers: Optional[int]) -> None:
+        max_length = randint(1, 11)
+        max_t = randint(15, 31)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        schedule_a = MinFeasScheduler(restarts=4).process(job_pool, max_concurrency)
+        schedule_b = MinFeasScheduler(time_budget=0, restarts=4, max_workers=max_workers).process(
+            job_pool, max_concurrency,
+        )
+
+        assert schedule_a.all_jobs_scheduled == schedule_b.all_jobs_scheduled
+
+        if schedule_b.all_jobs_scheduled is True:
+            check_feasibility(schedule_b, job_pool, max_concurrency)
+            assert schedule_b.interrupted is True
+
     @pytest.mark.repeat(1000)
     @pytest.mark.parametrize('scheduler_b', [GreedyIntervalsScheduler, GreedyScheduler])
     def test_against_lazy_activation(self, scheduler_b: Type[AbstractGreedyScheduler]) -> None:
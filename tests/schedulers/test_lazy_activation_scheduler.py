@@ -1,18 +1,30 @@
 # -*- coding: utf-8 -*-
 import pytest
-from random import randint
+from random import choice, randint
 from typing import Type
 
-from models import UnitJobPool, TimeInterval
-from schedulers import BruteForceScheduler, LazyActivationSchedulerNLogN, LazyActivationSchedulerT
-from schedulers.lazy_activation_scheduler import AbstractLazyActivationScheduler
+from models import Job, UnitJobPool, TimeInterval
+from schedulers import (
+    AbstractScheduler,
+    BruteForceScheduler,
+    IncrementalLazyActivationScheduler,
+    LazyActivationSchedulerAdaptive,
+    LazyActivationSchedulerArrays,
+    LazyActivationSchedulerNLogN,
+    LazyActivationSchedulerT,
+)
 from tests.schedulers.common import check_equality, generate_jobs_uniform_distribution
 
 
 class TestLazyActivationScheduler(object):
 
-    @pytest.mark.parametrize('scheduler', [LazyActivationSchedulerNLogN, LazyActivationSchedulerT])
-    def test_simple_examples(self, scheduler: Type[AbstractLazyActivationScheduler]) -> None:
+    @pytest.mark.parametrize('scheduler', [
+        LazyActivationSchedulerNLogN,
+        LazyActivationSchedulerT,
+        LazyActivationSchedulerArrays,
+        IncrementalLazyActivationScheduler,
+    ])
+    def test_simple_examples(self, scheduler: Type[AbstractScheduler]) -> None:
         job_pool = UnitJobPool()
         job_pool.add_job(1, 4)
         job_pool.add_job(4, 8)
@@ -39,8 +51,13 @@ class TestLazyActivationScheduler(object):
         ]
         assert len(schedule.job_schedules) == 1
 
-    @pytest.mark.parametrize('scheduler', [LazyActivationSchedulerNLogN, LazyActivationSchedulerT])
-    def test_empty(self, scheduler: Type[AbstractLazyActivationScheduler]) -> None:
+    @pytest.mark.parametrize('scheduler', [
+        LazyActivationSchedulerNLogN,
+        LazyActivationSchedulerT,
+        LazyActivationSchedulerArrays,
+        IncrementalLazyActivationScheduler,
+    ])
+    def test_empty(self, scheduler: Type[AbstractScheduler]) -> None:
         job_pool = UnitJobPool()
 
         schedule = scheduler().process(job_pool, 2)
@@ -49,9 +66,33 @@ class TestLazyActivationScheduler(object):
         assert schedule.active_time_intervals == []
         assert len(schedule.job_schedules) == 0
 
+    @pytest.mark.parametrize('scheduler', [
+        LazyActivationSchedulerNLogN,
+        LazyActivationSchedulerT,
+        LazyActivationSchedulerArrays,
+        LazyActivationSchedulerAdaptive,
+    ])
+    def test_long_chain(self, scheduler: Type[AbstractScheduler]) -> None:
+        job_pool = UnitJobPool()
+        for _ in range(5000):
+            job_pool.add_job(0, 100000)
+
+        schedule = scheduler().process(job_pool, 1)
+
+        assert schedule.all_jobs_scheduled is True
+        assert schedule.active_time_intervals == [
+            TimeInterval(95001, 100000)
+        ]
+
     @pytest.mark.repeat(1000)
-    @pytest.mark.parametrize('scheduler_b', [LazyActivationSchedulerNLogN, LazyActivationSchedulerT])
-    def test_against_brute_force(self, scheduler_b: Type[AbstractLazyActivationScheduler]) -> None:
+    @pytest.mark.parametrize('scheduler_b', [
+        LazyActivationSchedulerNLogN,
+        LazyActivationSchedulerT,
+        LazyActivationSchedulerArrays,
+        LazyActivationSchedulerAdaptive,
+        IncrementalLazyActivationScheduler,
+    ])
+    def test_against_brute_force(self, scheduler_b: Type[AbstractScheduler]) -> None:
         max_length = randint(1, 5)
         max_t = randint(4, 9)
         max_concurrency = randint(1, 4)
@@ -75,5 +116,118 @@ class TestLazyActivationScheduler(object):
 
         schedule_a = LazyActivationSchedulerNLogN.process(job_pool, max_concurrency)  # noqa
         schedule_b = LazyActivationSchedulerT.process(job_pool, max_concurrency)  # noqa
+        schedule_c = LazyActivationSchedulerArrays.process(job_pool, max_concurrency)  # noqa
+
+        check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
+        check_equality(schedule_a, schedule_c, job_pool, max_concurrency)
+
+    @pytest.mark.repeat(1000)
+    def test_adaptive(self) -> None:
+        max_length = randint(1, 31)
+        max_t = randint(50, 101)
+        max_concurrency = randint(1, 8)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+        offset = choice([0, 10 ** 9])
+        gap = choice([0, 1000, 10 ** 9])
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, 1))
+
+        sparse_job_pool = UnitJobPool()
+        for job in job_pool.jobs:
+            sparse_job_pool.add_job(
+                offset + job.release_time + job.release_time // 10 * gap,
+                offset + job.deadline + job.deadline // 10 * gap,
+            )
+
+        schedule_a = LazyActivationSchedulerNLogN.process(sparse_job_pool, max_concurrency)  # noqa
+        schedule_b = LazyActivationSchedulerAdaptive.process(sparse_job_pool, max_concurrency)  # noqa
+
+        check_equality(schedule_a, schedule_b, sparse_job_pool, max_concurrency)
+        assert len(schedule_a.job_schedules) == len(schedule_b.job_schedules)
+
+    @pytest.mark.repeat(1000)
+    def test_arrays(self) -> None:
+        max_length = randint(1, 31)
+        max_t = randint(50, 101)
+        max_concurrency = randint(1, 8)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, 1))
+
+        schedule_a = LazyActivationSchedulerT.process(job_pool, max_concurrency)  # noqa
+        schedule_b = LazyActivationSchedulerArrays.process_arrays(
+            [job.release_time for job in job_pool.jobs],
+            [job.deadline for job in job_pool.jobs],
+            max_concurrency,
+        )
 
         check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
+        assert len(schedule_a.job_schedules) == len(schedule_b.job_schedules)
+
+    @pytest.mark.repeat(200)
+    def test_incremental(self) -> None:
+        max_length = randint(1, 31)
+        max_t = randint(50, 101)
+        max_concurrency = randint(1, 8)
+
+        scheduler = IncrementalLazyActivationScheduler(max_concurrency)
+        job_pool = UnitJobPool()
+        execution_times = {}
+
+        for _ in range(randint(1, 50)):
+            if job_pool.size != 0 and randint(0, 2) == 0:
+                job = choice(list(job_pool.jobs))
+                job_pool.jobs.remove(job)
+                delta = scheduler.remove_job(job)
+                assert delta[job] is None
+            else:
+                release_time = randint(0, max_t)
+                job = Job(release_time, randint(release_time, release_time + max_length - 1), 1)
+                job_pool.jobs.add(job)
+                delta = scheduler.add_job(job)
+
+            for other, job_schedule in delta.items():
+                execution_times[other] = None if job_schedule is None else job_schedule.execution_start
+
+            schedule_a = LazyActivationSchedulerT.process(job_pool, max_concurrency)  # noqa
+            schedule_b = scheduler.schedule
+
+            check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
+            assert sorted((js.job, js.execution_start) for js in schedule_b.job_schedules) == sorted(
+                (other, t) for other, t in execution_times.items() if t is not None and other in job_pool.jobs
+            )
+
+    @pytest.mark.repeat(300)
+    def test_incremental_against_arrays(self) -> None:
+        max_length = randint(1, 31)
+        max_t = randint(5, 101)
+        max_concurrency = randint(1, 8)
+
+        scheduler = IncrementalLazyActivationScheduler()
+        job_pool = UnitJobPool()
+        for _ in range(randint(0, 20)):
+            release_time = randint(0, max_t)
+            job_pool.add_job(release_time, randint(release_time - 1, release_time + max_length - 1))
+
+        scheduler.process(job_pool, max_concurrency)
+        jobs = list(job_pool.jobs)
+
+        for _ in range(randint(1, 100)):
+            if jobs and randint(0, 2) == 0:
+                job = jobs.pop(randint(0, len(jobs) - 1))
+                scheduler.remove_job(job)
+            else:
+                release_time = randint(0, max_t)
+                job = Job(release_time, randint(release_time, release_time + max_length - 1), 1)
+                jobs.append(job)
+                scheduler.add_job(job)
+
+            schedule = LazyActivationSchedulerArrays.process_arrays(
+                [job.release_time for job in jobs], [job.deadline for job in jobs], max_concurrency,
+            )
+            execution_times = {js.job: js.execution_start for js in scheduler.schedule.job_schedules}
+
+            assert [execution_times.get(job) for job in jobs] == [
+                t if scheduled is True else None
+                for t, scheduled in zip(schedule.execution_times.tolist(), schedule.scheduled.tolist())
+            ]
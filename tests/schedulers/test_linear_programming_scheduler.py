@@ -1,15 +1,28 @@
 # -*- coding: utf-8 -*-
+import math
 import pytest
-from random import randint
+from bisect import bisect_right
+from random import choice, randint
 
-from models import JobPool
+from models import Job, JobPool
 from schedulers import (
     BruteForceScheduler,
     DegreeConstrainedSubgraphScheduler,
+    FlowMethod,
+    GreedyScheduler,
+    IntegerProgrammingScheduler,
     LazyActivationSchedulerT,
+    LinearProgrammingMethod,
     LinearProgrammingRoundedScheduler,
+    LinearProgrammingScheduler,
+    LinearProgrammingSession,
+)
+from tests.schedulers.common import (
+    check_2_approximation,
+    check_equality,
+    check_feasibility,
+    generate_jobs_uniform_distribution,
 )
-from tests.schedulers.common import check_2_approximation, generate_jobs_uniform_distribution
 
 
 class TestLinearProgrammingScheduler(object):
@@ -34,7 +47,70 @@ class TestLinearProgrammingScheduler(object):
         assert len(schedule.job_schedules) == 2
 
     @pytest.mark.repeat(1000)
-    def test_against_brute_force(self) -> None:
+    def test_compressed_linear_program(self) -> None:
+        max_length = randint(1, 11)
+        max_t = randint(15, 31)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        schedule_a = LinearProgrammingScheduler().process(job_pool, max_concurrency)
+        schedule_b = LinearProgrammingScheduler(compress_time_slots=True).process(job_pool, max_concurrency)
+
+        assert schedule_a.all_jobs_scheduled == schedule_b.all_jobs_scheduled
+
+        if schedule_a.all_jobs_scheduled is True:
+            active_time_a = sum(interval.end - interval.start for interval in schedule_a.active_time_intervals)
+            active_time_b = sum(interval.end - interval.start for interval in schedule_b.active_time_intervals)
+
+            assert active_time_a == pytest.approx(active_time_b, abs=1e-6)
+
+            for job_schedule in schedule_b.job_schedules:
+                execution_time = sum(interval.end - interval.start for interval in job_schedule.execution_intervals)
+                assert execution_time >= job_schedule.job.duration - 1e-6
+
+    @pytest.mark.repeat(200)
+    def test_session(self) -> None:
+        max_length = randint(1, 11)
+        max_t = randint(15, 31)
+        max_concurrency = randint(1, 4)
+
+        session = LinearProgrammingSession(max_concurrency)
+        job_pool = JobPool()
+
+        for _ in range(randint(1, 60)):
+            operation = randint(0, 3)
+
+            if operation == 0 and job_pool.size != 0:
+                job = choice(list(job_pool.jobs))
+                job_pool.jobs.remove(job)
+                session.remove_job(job)
+            elif operation == 1:
+                max_concurrency = randint(1, 4)
+                session.set_max_concurrency(max_concurrency)
+            else:
+                length = randint(1, max_length)
+                release_time = randint(0, max_t - length)
+                job = Job(release_time, release_time + length - 1, randint(1, length))
+                job_pool.jobs.add(job)
+                session.add_job(job)
+
+            schedule_a = LinearProgrammingScheduler().process(job_pool, max_concurrency)
+            schedule_b = session.solve()
+
+            assert schedule_a.all_jobs_scheduled == schedule_b.all_jobs_scheduled
+
+            if schedule_a.all_jobs_scheduled is True:
+                active_time_a = sum(interval.end - interval.start for interval in schedule_a.active_time_intervals)
+                active_time_b = sum(interval.end - interval.start for interval in schedule_b.active_time_intervals)
+
+                assert active_time_a == pytest.approx(active_time_b, abs=1e-6)
+                assert len(schedule_b.job_schedules) == job_pool.size
+
+    @pytest.mark.repeat(1000)
+    @pytest.mark.parametrize('compress_time_slots', [False, True])
+    def test_against_brute_force(self, compress_time_slots: bool) -> None:
         max_length = randint(1, 5)
         max_t = randint(4, 9)
         max_concurrency = randint(1, 4)
@@ -43,10 +119,54 @@ class TestLinearProgrammingScheduler(object):
         job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
 
         schedule_a = BruteForceScheduler().process(job_pool, max_concurrency)
-        schedule_b = LinearProgrammingRoundedScheduler().process(job_pool, max_concurrency)
+        schedule_b = LinearProgrammingRoundedScheduler(compress_time_slots=compress_time_slots).process(
+            job_pool, max_concurrency,
+        )
 
         check_2_approximation(schedule_a, schedule_b, job_pool, max_concurrency)
 
+    @pytest.mark.repeat(1000)
+    def test_rounding(self) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(4, 15)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        schedule_a = LinearProgrammingScheduler().process(job_pool, max_concurrency)
+        schedule_b = LinearProgrammingRoundedScheduler().process(job_pool, max_concurrency)
+
+        assert schedule_a.all_jobs_scheduled == schedule_b.all_jobs_scheduled
+
+        if schedule_a.all_jobs_scheduled is False:
+            return
+
+        check_feasibility(schedule_b, job_pool, max_concurrency)
+
+        # The open time of the LP before every deadline is rounded up and placed right before the deadline
+        deadlines = sorted({job.deadline + 1 for job in job_pool.jobs})
+        open_times = [0.0] * len(deadlines)
+        for interval in schedule_a.active_time_intervals:
+            open_times[bisect_right(deadlines, interval.start)] += interval.end - interval.start
+
+        active_timestamps = set()
+        for deadline, open_time in zip(deadlines, open_times):
+            active_timestamps.update(range(deadline - math.ceil(open_time - 1e-7), deadline))
+
+        assert sorted(t for interval in schedule_b.active_time_intervals for t in interval) == sorted(active_timestamps)
+
+    def test_rounded_flow_method(self) -> None:
+        with pytest.warns(DeprecationWarning):
+            scheduler = LinearProgrammingRoundedScheduler(LinearProgrammingMethod.HIGHS, FlowMethod.EDMONDS_KARP)
+
+        assert scheduler.compress_time_slots is False
+
+        with pytest.warns(DeprecationWarning):
+            scheduler = LinearProgrammingRoundedScheduler(LinearProgrammingMethod.HIGHS, FlowMethod.EDMONDS_KARP, True)
+
+        assert scheduler.compress_time_slots is True
+
     @pytest.mark.repeat(1000)
     def test_against_lazy_activation(self) -> None:
         max_length = randint(1, 5)
@@ -73,3 +193,43 @@ class TestLinearProgrammingScheduler(object):
         schedule_b = LinearProgrammingRoundedScheduler().process(job_pool, 2)
 
         check_2_approximation(schedule_a, schedule_b, job_pool, 2)
+
+    @pytest.mark.repeat(1000)
+    @pytest.mark.parametrize('compress_time_slots', [False, True])
+    def test_integer_programming_against_brute_force(self, compress_time_slots: bool) -> None:
+        max_length = randint(1, 5)
+        max_t = randint(4, 9)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        schedule_a = BruteForceScheduler().process(job_pool, max_concurrency)
+        schedule_b = IntegerProgrammingScheduler(compress_time_slots=compress_time_slots).process(
+            job_pool, max_concurrency,
+        )
+
+        check_equality(schedule_a, schedule_b, job_pool, max_concurrency)
+        assert schedule_b.interrupted is False
+
+    @pytest.mark.repeat(50)
+    def test_integer_programming_time_budget(self) -> None:
+        max_length = randint(5, 21)
+        max_t = randint(50, 101)
+        max_concurrency = randint(1, 4)
+        number_of_jobs = randint(1, max_t // max_length * max_concurrency + 1)
+
+        job_pool = generate_jobs_uniform_distribution(number_of_jobs, max_t, (1, max_length), (1, max_length))
+
+        schedule_a = GreedyScheduler(time_budget=0).process(job_pool, max_concurrency)
+        schedule_b = IntegerProgrammingScheduler(time_budget=0).process(job_pool, max_concurrency)
+
+        assert schedule_a.all_jobs_scheduled == schedule_b.all_jobs_scheduled
+
+        if schedule_b.all_jobs_scheduled is True:
+            check_feasibility(schedule_b, job_pool, max_concurrency)
+
+            active_time_a = sum(interval.duration for interval in schedule_a.active_time_intervals)
+            active_time_b = sum(interval.duration for interval in schedule_b.active_time_intervals)
+
+            assert active_time_b <= active_time_a
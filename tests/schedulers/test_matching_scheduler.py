@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 import pytest
-from random import randint, random
+from itertools import combinations
+from networkx import Graph, gnp_random_graph, max_weight_matching
+from random import randint, random, shuffle
+from typing import Any, Dict, List, Set, Tuple
 
 from models import JobPoolMI, TimeInterval, UnitJobPoolMI
 from schedulers import (
@@ -10,6 +13,55 @@ from schedulers import (
     MatchingScheduler,
 )
 from tests.schedulers.common import check_equality, generate_jobs_uniform_distribution, generate_mi_jobs
+from utils import EdmondsBlossomMatching, HopcroftKarpMatching, UpperDegreeConstrainedSubgraph
+
+
+def generate_graph(max_nodes: int) -> Graph:
+    g = gnp_random_graph(randint(0, max_nodes), random())
+    g.add_nodes_from(range(g.number_of_nodes(), g.number_of_nodes() + randint(0, 3)))
+
+    return g
+
+
+def generate_bipartite_graph(max_nodes: int) -> Tuple[Graph, List[Any]]:
+    g = Graph()
+    left = [('l', u) for u in range(randint(0, max_nodes))]
+    right = [('r', v) for v in range(randint(0, max_nodes))]
+    g.add_nodes_from(left + right)
+
+    p = random()
+    g.add_edges_from((u, v) for u in left for v in right if random() < p)
+
+    # The nodes of one side that are not in the graph are ignored
+    return g, left + [('l', -1)]
+
+
+def check_matching(g: Graph, matching: Dict[Any, Any]) -> None:
+    for u, v in matching.items():
+        assert matching[v] == u
+        assert g.has_edge(u, v)
+
+
+def get_max_dcs_size(number_of_nodes: int, edges: List[Tuple[int, int]], constraints: List[int]) -> int:
+    for size in range(len(edges), 0, -1):
+        for selected_edges in combinations(edges, size):
+            degrees = [0] * number_of_nodes
+            for u, v in selected_edges:
+                degrees[u] += 1
+                degrees[v] += 1
+
+            if all(degree <= constraint for degree, constraint in zip(degrees, constraints)):
+                return size
+
+    return 0
+
+
+def check_dcs(g: Graph, constraints: Dict[Any, int], degree_constrained_subgraph: Dict[Any, Set[Any]]) -> None:
+    for u, neighbours in degree_constrained_subgraph.items():
+        assert len(neighbours) <= constraints[u]
+        for v in neighbours:
+            assert g.has_edge(u, v)
+            assert u in degree_constrained_subgraph[v]
 
 
 class TestMatchingScheduler(object):
@@ -144,3 +196,105 @@ class TestMatchingScheduler(object):
         schedule_b = MatchingScheduler().process(job_pool)  # noqa
 
         check_equality(schedule_a, schedule_b, job_pool, 2)
+
+    @pytest.mark.repeat(1000)
+    def test_edmonds_blossom_matching(self) -> None:
+        g = generate_graph(20)
+
+        matching = EdmondsBlossomMatching.process(g)
+
+        check_matching(g, matching)
+        assert len(matching) == 2 * len(max_weight_matching(g, maxcardinality=True))
+
+    @pytest.mark.repeat(1000)
+    def test_edmonds_blossom_matching_initial_matching(self) -> None:
+        g = generate_graph(20)
+
+        edges = list(g.edges)
+        shuffle(edges)
+
+        initial_matching = {}
+        for u, v in edges[:randint(0, len(edges))]:
+            if u not in initial_matching and v not in initial_matching:
+                initial_matching[u], initial_matching[v] = v, u
+
+        matching = EdmondsBlossomMatching.process(g, initial_matching)
+
+        check_matching(g, matching)
+        assert len(matching) == 2 * len(max_weight_matching(g, maxcardinality=True))
+
+        # An augmenting path keeps all the matched nodes matched
+        assert set(initial_matching) <= set(matching)
+
+    @pytest.mark.repeat(1000)
+    def test_hopcroft_karp_matching(self) -> None:
+        g, left = generate_bipartite_graph(15)
+
+        matching = HopcroftKarpMatching.process(g, left)
+
+        check_matching(g, matching)
+        assert len(matching) == 2 * len(max_weight_matching(g, maxcardinality=True))
+        assert len(matching) == len(EdmondsBlossomMatching.process(g))
+
+    @pytest.mark.repeat(1000)
+    def test_udcs_process_arrays(self) -> None:
+        g = generate_graph(7)
+        edges = list(g.edges)[:randint(0, 10)]
+        tails, heads = [u for u, _ in edges], [v for _, v in edges]
+        constraints = [randint(0, 3) for _ in g.nodes]
+
+        adjacency, offsets = UpperDegreeConstrainedSubgraph.construct_h(len(g), tails, heads, constraints)
+
+        assert offsets[-1] == sum(constraints)
+        assert len(adjacency) == offsets[-1] + 2 * len(edges)
+
+        h = Graph()
+        h.add_nodes_from(range(len(adjacency)))
+        h.add_edges_from((x, y) for x, neighbours in enumerate(adjacency) for y in neighbours)
+
+        # Every edge of the original graph is covered by its own pair of vertices or by the copies of its nodes, so
+        # the matching of the helper graph exceeds the maximum DCS by the number of edges.
+        max_dcs_size = get_max_dcs_size(len(g), edges, constraints)
+        assert len(max_weight_matching(h, maxcardinality=True)) == len(edges) + max_dcs_size
+
+        initial_edges = None
+        if randint(0, 1) == 1:
+            initial_edges = []
+            degrees = [0] * len(g)
+            for e, (u, v) in enumerate(edges):
+                if randint(0, 1) == 1 and degrees[u] < constraints[u] and degrees[v] < constraints[v]:
+                    initial_edges.append(e)
+                    degrees[u] += 1
+                    degrees[v] += 1
+
+        selected_edges = UpperDegreeConstrainedSubgraph.process_arrays(
+            len(g), tails, heads, constraints, initial_edges,
+        ).tolist()
+
+        degrees = [0] * len(g)
+        for e in selected_edges:
+            degrees[tails[e]] += 1
+            degrees[heads[e]] += 1
+
+        assert len(set(selected_edges)) == len(selected_edges) == max_dcs_size
+        assert all(degree <= constraint for degree, constraint in zip(degrees, constraints))
+
+    @pytest.mark.repeat(1000)
+    def test_udcs_process_bipartite(self) -> None:
+        g, left = generate_bipartite_graph(10)
+        max_constraint = randint(1, 3)
+        constraints = {u: randint(0, max_constraint) for u in g.nodes}
+
+        dcs_a = UpperDegreeConstrainedSubgraph.process(g, constraints)
+        dcs_b = UpperDegreeConstrainedSubgraph.process_bipartite(g, constraints, left)
+
+        check_dcs(g, constraints, dcs_a)
+        check_dcs(g, constraints, dcs_b)
+
+        size_a = sum(len(neighbours) for neighbours in dcs_a.values()) // 2
+        size_b = sum(len(neighbours) for neighbours in dcs_b.values()) // 2
+        assert size_a == size_b
+
+        # With unit constraints, the DCS is a maximum matching
+        if all(constraint == 1 for constraint in constraints.values()):
+            assert size_b == len(max_weight_matching(g, maxcardinality=True))
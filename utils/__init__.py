@@ -1,13 +1,22 @@
 # -*- coding: utf-8 -*-
+from .array_flow_network import ArrayFlowNetwork
+from .availability_index import AvailabilityIndex
+from .capacity_bounds import CapacityBounds
 from .create_image import save_image_from_schedule, show_image_from_schedule
-from .disjoint_set_node import DisjointSetNode
+from .disjoint_set import DisjointSet
+from .incremental_flow_network import IncrementalFlowNetwork
 from .maximum_flow import FordFulkerson, ford_fulkerson
-from .maximum_matching import EdmondsBlossomMatching, UpperDegreeConstrainedSubgraph
+from .maximum_matching import EdmondsBlossomMatching, HopcroftKarpMatching, UpperDegreeConstrainedSubgraph
 
 __all__ = [
-    'DisjointSetNode',
+    'ArrayFlowNetwork',
+    'AvailabilityIndex',
+    'CapacityBounds',
+    'DisjointSet',
     'EdmondsBlossomMatching',
     'FordFulkerson',
+    'HopcroftKarpMatching',
+    'IncrementalFlowNetwork',
     'UpperDegreeConstrainedSubgraph',
     'ford_fulkerson',
     'save_image_from_schedule',
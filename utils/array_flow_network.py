@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+from numpy import arange, argsort, array, bincount, cumsum, full, int64, ndarray, repeat, unique, zeros
+from typing import Dict, Tuple
+
+
+class ArrayFlowNetwork(object):
+    """
+    A compact flow network that stores its edges, capacities and flows in NumPy arrays. Every edge is stored together
+    with its reverse edge at the neighbouring index, and the adjacency is kept in the CSR format, which is rebuilt only
+    when new edges are added. Nodes are expected to be non-negative integers. The maximum flow is computed with Dinitz'
+    algorithm, where the level graph is built by a vectorized breadth-first search.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the class with parameters.
+        """
+        self._number_of_nodes = 0
+        self._number_of_edges = 0
+        self._edge_index = {}
+        self._tails = zeros(16, dtype=int64)
+        self._heads = zeros(16, dtype=int64)
+        self._capacities = zeros(16, dtype=int64)
+        self._flows = zeros(16, dtype=int64)
+        self._is_edge = zeros(16, dtype=bool)
+        self._csr = None
+        self._checkpoint = None
+
+    def _reserve(self, number_of_edges: int) -> None:
+        if number_of_edges <= self._tails.size:
+            return
+
+        self._resize(max(number_of_edges, 2 * self._tails.size))
+
+    def _resize(self, size: int) -> None:
+        for name in ('_tails', '_heads', '_capacities', '_flows', '_is_edge'):
+            values = getattr(self, name)
+            if values.size != size:
+                resized = zeros(size, dtype=values.dtype)
+                resized[:values.size] = values
+                setattr(self, name, resized)
+
+    def _get_csr(self) -> Tuple[ndarray, ndarray]:
+        if self._csr is None:
+            tails = self._tails[:self._number_of_edges]
+
+            offsets = zeros(self._number_of_nodes + 1, dtype=int64)
+            offsets[1:] = cumsum(bincount(tails, minlength=self._number_of_nodes))
+
+            self._csr = (offsets, argsort(tails, kind='stable'))
+
+        return self._csr
+
+    def add_node(self, u: int) -> None:
+        """
+        Adds a node to the network.
+        :param u: Node to add.
+        :return: None
+        """
+        if u >= self._number_of_nodes:
+            self._number_of_nodes = u + 1
+            self._csr = None
+
+    def has_edge(self, u: int, v: int) -> bool:
+        """
+        Checks whether the network contains an edge.
+        :param u: Tail of the edge.
+        :param v: Head of the edge.
+        :return: True if the edge is present, False otherwise.
+        """
+        e = self._edge_index.get((u, v), None)
+        return e is not None and bool(self._is_edge[e])
+
+    def get_capacity(self, u: int, v: int) -> int:
+        """
+        Gets the capacity of an edge.
+        :param u: Tail of the edge.
+        :param v: Head of the edge.
+        :return: Capacity of the edge, 0 if the edge is not present.
+        """
+        return int(self._capacities[self._edge_index[(u, v)]]) if self.has_edge(u, v) else 0
+
+    def add_edge(self, u: int, v: int, capacity: int) -> None:
+        """
+        Adds an edge to the network or updates the capacity of an existing one.
+        :param u: Tail of the edge.
+        :param v: Head of the edge.
+        :param capacity: Capacity of the edge.
+        :return: None
+        """
+        e = self._edge_index.get((u, v), None)
+
+        if e is None:
+            e = self._number_of_edges
+            self._reserve(e + 2)
+
+            self._tails[e], self._heads[e] = u, v
+            self._tails[e + 1], self._heads[e + 1] = v, u
+
+            self._edge_index[(u, v)] = e
+            self._number_of_edges += 2
+            self._csr = None
+
+            self.add_node(max(u, v))
+
+        self._capacities[e] = capacity
+        self._is_edge[e] = True
+
+    def remove_edge(self, u: int, v: int) -> None:
+        """
+        Removes an edge from the network.
+        :param u: Tail of the edge.
+        :param v: Head of the edge.
+        :return: None
+        """
+        e = self._edge_index[(u, v)]
+
+        self._capacities[e] = 0
+        self._is_edge[e] = False
+
+    def checkpoint(self) -> None:
+        """
+        Saves the capacities and the flow of the network, so that the changes made afterwards can be rolled back.
+        :return: None
+        """
+        self._checkpoint = (
+            self._number_of_edges, self._capacities.copy(), self._flows.copy(), self._is_edge.copy(),
+        )
+
+    def commit(self) -> None:
+        """
+        Discards the saved state and keeps the changes.
+        :return: None
+        """
+        self._checkpoint = None
+
+    def rollback(self) -> None:
+        """
+        Reverts the network to the state it had at the last checkpoint.
+        :return: None
+        """
+        number_of_edges, self._capacities, self._flows, self._is_edge = self._checkpoint
+        self._checkpoint = None
+        self._resize(self._tails.size)
+
+        if number_of_edges != self._number_of_edges:
+            self._edge_index = {edge: e for edge, e in self._edge_index.items() if e < number_of_edges}
+            self._number_of_edges = number_of_edges
+            self._csr = None
+
+    def _compute_levels(self, s: int, t: int, residual: ndarray) -> ndarray:
+        offsets, order = self._get_csr()
+        heads = self._heads[:self._number_of_edges]
+
+        levels = full(self._number_of_nodes, -1, dtype=int64)
+        levels[s] = 0
+
+        frontier = zeros(1, dtype=int64) + s
+        level = 0
+
+        while frontier.size != 0 and levels[t] == -1:
+            starts = offsets[frontier]
+            counts = offsets[frontier + 1] - starts
+            positions = repeat(starts - cumsum(counts) + counts, counts) + arange(counts.sum())
+
+            edges = order[positions]
+            candidates = heads[edges[residual[edges] > 0]]
+            frontier = unique(candidates[levels[candidates] == -1])
+
+            level += 1
+            levels[frontier] = level
+
+        return levels
+
+    def _find_blocking_flow(self, s: int, t: int, residual: ndarray, levels: ndarray) -> Tuple[int, ndarray]:
+        offsets, order = self._get_csr()
+
+        offsets = offsets.tolist()
+        order = order.tolist()
+        heads = self._heads[:self._number_of_edges].tolist()
+        residual = residual.tolist()
+        levels = levels.tolist()
+
+        pointers = offsets[:-1]
+        total = 0
+        path = []
+        u = s
+
+        while True:
+            if u == t:
+                a = min(residual[e] for e in path)
+
+                for e in path:
+                    residual[e] -= a
+                    residual[e ^ 1] += a
+
+                total += a
+                path = []
+                u = s
+                continue
+
+            while pointers[u] < offsets[u + 1]:
+                e = order[pointers[u]]
+                if residual[e] > 0 and levels[heads[e]] == levels[u] + 1:
+                    break
+                pointers[u] += 1
+
+            if pointers[u] < offsets[u + 1]:
+                e = order[pointers[u]]
+                path.append(e)
+                u = heads[e]
+                continue
+
+            levels[u] = -1
+
+            if not path:
+                break
+
+            e = path.pop()
+            u = heads[e ^ 1]
+            pointers[u] += 1
+
+        return total, array(residual, dtype=int64)
+
+    def process(self, s: int, t: int) -> int:
+        """
+        Computes the maximum flow from source to sink.
+        :param s: Source of the network.
+        :param t: Sink of the network.
+        :return: Maximum flow value.
+        """
+        self.add_node(max(s, t))
+
+        capacities = self._capacities[:self._number_of_edges]
+        residual = capacities.copy()
+        flow_value = 0
+
+        while True:
+            levels = self._compute_levels(s, t, residual)
+
+            if levels[t] == -1:
+                break
+
+            a, residual = self._find_blocking_flow(s, t, residual, levels)
+            flow_value += a
+
+        self._flows[:self._number_of_edges] = capacities - residual
+
+        return flow_value
+
+    def flow_dict(self) -> Dict[int, Dict[int, int]]:
+        """
+        Gets the current flow in the format of the networkx maximum_flow function.
+        :return: Dictionary mapping every edge of the network to the flow going through it.
+        """
+        flow_dict = {u: {} for u in range(self._number_of_nodes)}
+
+        for (u, v), e in self._edge_index.items():
+            if self._is_edge[e]:
+                flow_dict[u][v] = max(int(self._flows[e]), 0)
+
+        return flow_dict
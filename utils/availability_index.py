@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+from bisect import bisect_right
+from typing import List, Optional
+
+from models import JobMI, TimeInterval
+
+
+class AvailabilityIndex(object):
+    """
+    Index of the jobs available at each timestamp, built by sweeping over the endpoints of the availability intervals.
+    The timestamps at which at least one job is available are split into segments, s.t. all the timestamps of a segment
+    have the same set of available jobs. If compression is enabled, the segments are maximal, otherwise every segment
+    consists of a single timestamp.
+    """
+
+    def __init__(self, jobs: List[JobMI], compress: bool = True) -> None:
+        """
+        Initialize the class with parameters.
+        :param jobs: Jobs to build the index for, the jobs are referred to by their positions in the list.
+        :param compress: Whether consecutive timestamps with the same available jobs should be grouped together.
+        """
+        self.segments = []
+        self.segment_jobs = []
+
+        events = {}
+        for i, job in enumerate(jobs):
+            for interval in job.availability_intervals:
+                if interval.start <= interval.end:
+                    events.setdefault(interval.start, []).append((i, 1))
+                    events.setdefault(interval.end + 1, []).append((i, -1))
+
+        points = sorted(events.keys())
+        available = {}
+
+        for k, point in enumerate(points):
+            for i, delta in events[point]:
+                available[i] = available.get(i, 0) + delta
+                if available[i] == 0:
+                    del available[i]
+
+            if not available:
+                continue
+
+            segment_jobs = sorted(available.keys())
+            start, end = point, points[k + 1] - 1
+
+            if compress is False:
+                for t in range(start, end + 1):
+                    self.segments.append(TimeInterval(t, t))
+                    self.segment_jobs.append(segment_jobs)
+            elif self.segments and self.segments[-1].end + 1 == start and self.segment_jobs[-1] == segment_jobs:
+                self.segments[-1].end = end
+            else:
+                self.segments.append(TimeInterval(start, end))
+                self.segment_jobs.append(segment_jobs)
+
+        self._starts = [segment.start for segment in self.segments]
+
+    @property
+    def size(self) -> int:
+        return len(self.segments)
+
+    def segment_of(self, t: int) -> Optional[int]:
+        """
+        Finds the segment containing a timestamp.
+        :param t: Timestamp to look up.
+        :return: Index of the segment, None if no job is available at the timestamp.
+        """
+        k = bisect_right(self._starts, t) - 1
+
+        if k < 0 or self.segments[k].end < t:
+            return None
+
+        return k
+
+    def jobs_at(self, t: int) -> List[int]:
+        """
+        Gets the jobs available at a timestamp.
+        :param t: Timestamp to look up.
+        :return: Sorted indices of the available jobs.
+        """
+        k = self.segment_of(t)
+
+        if k is None:
+            return []
+
+        return self.segment_jobs[k]
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+from typing import List, Optional, Set
+
+from models import JobMI
+from utils.availability_index import AvailabilityIndex
+
+
+class CapacityBounds(object):
+    """
+    Necessary conditions for the feasibility of a set of open time slots, kept up to date as the time slots are opened
+    and closed. A job can be processed at most once per open time slot of its availability, and all the jobs available
+    only within the availability of another job without gaps have to be processed in the open time slots of that
+    availability. In addition, the open time slots at which any job is available have to fit all the jobs. If any of the
+    bounds is violated, no feasible schedule exists and the feasibility flow does not need to be computed.
+    """
+
+    def __init__(
+            self,
+            jobs: List[JobMI],
+            index: AvailabilityIndex,
+            max_concurrency: int,
+            active_timestamps: Optional[Set[int]] = None,
+    ) -> None:
+        """
+        Initialize the class with parameters.
+        :param jobs: Jobs to compute the bounds for, the jobs are referred to by their positions in the list.
+        :param index: Availability index of the jobs.
+        :param max_concurrency: Maximum number of jobs allowed to run concurrently.
+        :param active_timestamps: Open time slots, None if all the time slots are open.
+        """
+        self.max_concurrency = max_concurrency
+        self.duration_sum = sum([job.duration for job in jobs])
+
+        self._required_time_slots = [
+            max(job.duration, -(-demand // max_concurrency))
+            for job, demand in zip(jobs, self._get_nested_demands(jobs, index))
+        ]
+
+        self._open_time_slots = [0] * len(jobs)
+        self._total_open_time_slots = 0
+
+        for k, segment in enumerate(index.segments):
+            if active_timestamps is None:
+                open_time_slots = segment.duration
+            else:
+                open_time_slots = sum(1 for t in segment if t in active_timestamps)
+
+            self.open(index.segment_jobs[k], open_time_slots)
+
+    @staticmethod
+    def _get_nested_demands(jobs: List[JobMI], index: AvailabilityIndex) -> List[int]:
+        firsts, lasts, counts = [None] * len(jobs), [None] * len(jobs), [0] * len(jobs)
+        for k, segment_jobs in enumerate(index.segment_jobs):
+            for i in segment_jobs:
+                if firsts[i] is None:
+                    firsts[i] = k
+                lasts[i] = k
+                counts[i] += 1
+
+        # A job available at every segment between its first and last one contains exactly the jobs whose segments
+        # lie within that range, so the demands are sums over dominated ranges, computed by a sweep over the first
+        # segments in decreasing order with a Fenwick tree over the last segments. The demand of a job with gaps in
+        # its availability is bounded by its own duration only.
+        durations = [job.duration for job in jobs]
+        demands = list(durations)
+        unavailable_demand = sum([durations[i] for i in range(len(jobs)) if firsts[i] is None])
+
+        available_jobs = sorted([i for i in range(len(jobs)) if firsts[i] is not None], key=lambda i: -firsts[i])
+        tree = [0] * (index.size + 1)
+        j = 0
+
+        for i in available_jobs:
+            if counts[i] != lasts[i] - firsts[i] + 1:
+                continue
+
+            while j < len(available_jobs) and firsts[available_jobs[j]] >= firsts[i]:
+                k = lasts[available_jobs[j]] + 1
+                while k <= index.size:
+                    tree[k] += durations[available_jobs[j]]
+                    k += k & -k
+                j += 1
+
+            demand = unavailable_demand
+            k = lasts[i] + 1
+            while k > 0:
+                demand += tree[k]
+                k -= k & -k
+
+            demands[i] = demand
+
+        return demands
+
+    def is_satisfied(self) -> bool:
+        """
+        Checks whether the current open time slots satisfy all the bounds.
+        :return: False if no feasible schedule exists, True if the feasibility flow has to decide.
+        """
+        if self.max_concurrency * self._total_open_time_slots < self.duration_sum:
+            return False
+
+        return all(
+            open_time_slots >= required_time_slots
+            for open_time_slots, required_time_slots in zip(self._open_time_slots, self._required_time_slots)
+        )
+
+    def can_close(self, job_indices: List[int], count: int = 1) -> bool:
+        """
+        Checks whether closing time slots keeps the bounds satisfied, assuming they are satisfied now.
+        :param job_indices: Jobs available at the time slots to close.
+        :param count: Number of time slots to close.
+        :return: False if closing the time slots makes the schedule infeasible, True if the feasibility flow has to
+        decide.
+        """
+        if not job_indices:
+            return True
+
+        if self.max_concurrency * (self._total_open_time_slots - count) < self.duration_sum:
+            return False
+
+        return all(self._open_time_slots[i] - count >= self._required_time_slots[i] for i in job_indices)
+
+    def open(self, job_indices: List[int], count: int = 1) -> None:
+        """
+        Opens time slots.
+        :param job_indices: Jobs available at the time slots to open.
+        :param count: Number of time slots to open.
+        :return: None
+        """
+        if not job_indices:
+            return
+
+        for i in job_indices:
+            self._open_time_slots[i] += count
+
+        self._total_open_time_slots += count
+
+    def close(self, job_indices: List[int], count: int = 1) -> None:
+        """
+        Closes time slots.
+        :param job_indices: Jobs available at the time slots to close.
+        :param count: Number of time slots to close.
+        :return: None
+        """
+        self.open(job_indices, -count)
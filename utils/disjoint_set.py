@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+from array import array
+
+
+class DisjointSet(object):
+    """
+    Disjoint sets of the elements 0, ..., size - 1 stored in integer arrays. The sets are united by size and the paths
+    are compressed iteratively, so long chains neither hit the recursion limit nor allocate an object per element.
+    Every set has a representative element, which is independent of the internal tree structure: uniting two sets keeps
+    the representative of the second one.
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Initialize the class with parameters.
+        :param size: Number of elements.
+        """
+        self._parents = array('q', range(size))
+        self._sizes = array('q', [1]) * size
+        self._representatives = array('q', range(size))
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def _root(self, u: int) -> int:
+        parents = self._parents
+
+        root = u
+        while parents[root] != root:
+            root = parents[root]
+
+        while parents[u] != root:
+            parents[u], u = root, parents[u]
+
+        return root
+
+    def find(self, u: int) -> int:
+        """
+        Gets the representative of the set containing an element.
+        :param u: Element of the set.
+        :return: Representative element.
+        """
+        return self._representatives[self._root(u)]
+
+    def union(self, u: int, v: int) -> None:
+        """
+        Unite the sets containing two elements into a single set represented by the representative of the second set.
+        :param u: Element of the first set.
+        :param v: Element of the second set.
+        :return: None
+        """
+        root = self._root(u)
+        other_root = self._root(v)
+
+        if root == other_root:
+            return
+
+        representative = self._representatives[other_root]
+
+        if self._sizes[root] < self._sizes[other_root]:
+            root, other_root = other_root, root
+
+        self._parents[other_root] = root
+        self._sizes[root] += self._sizes[other_root]
+        self._representatives[root] = representative
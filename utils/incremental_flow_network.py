@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+
+class IncrementalFlowNetwork(object):
+    """
+    A flow network that keeps its flow and residual network between maximum flow computations. It implements the subset
+    of the networkx DiGraph interface used by the greedy schedulers, so it can be used in place of a DiGraph. Whenever
+    the capacity of an edge drops below the flow going through it, only the displaced flow is re-routed on the next call
+    of process, the rest of the flow is reused. Changes made after a checkpoint can be rolled back in time proportional
+    to the number of changes.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the class with parameters.
+        """
+        self._capacity = {}
+        self._flow = {}
+        self._successors = {}
+        self._excess = {}
+        self._journal = None
+        self._journal_state = None
+        self._terminals = None
+        self.flow_value = 0
+
+    def _record(self, u: Any, v: Any) -> None:
+        if self._journal is not None:
+            self._journal.append((u, v, self._capacity[u][v], self._flow[u][v], v in self._successors[u]))
+
+    def _add_flow(self, u: Any, v: Any, amount: int) -> None:
+        self._record(u, v)
+        self._flow[u][v] += amount
+        self._flow[v][u] -= amount
+
+    def _add_excess(self, u: Any, amount: int) -> None:
+        self._excess[u] = self._excess.get(u, 0) + amount
+        if self._excess[u] == 0:
+            del self._excess[u]
+
+    def add_node(self, u: Any) -> None:
+        """
+        Adds a node to the network.
+        :param u: Node to add.
+        :return: None
+        """
+        if u not in self._capacity:
+            self._capacity[u] = {}
+            self._flow[u] = {}
+            self._successors[u] = set()
+
+    def has_edge(self, u: Any, v: Any) -> bool:
+        """
+        Checks whether the network contains an edge.
+        :param u: Tail of the edge.
+        :param v: Head of the edge.
+        :return: True if the edge is present, False otherwise.
+        """
+        return u in self._successors and v in self._successors[u]
+
+    def get_capacity(self, u: Any, v: Any) -> int:
+        """
+        Gets the capacity of an edge.
+        :param u: Tail of the edge.
+        :param v: Head of the edge.
+        :return: Capacity of the edge, 0 if the edge is not present.
+        """
+        return self._capacity[u][v] if self.has_edge(u, v) else 0
+
+    def add_edge(self, u: Any, v: Any, capacity: int) -> None:
+        """
+        Adds an edge to the network or updates the capacity of an existing one. If the new capacity is lower than the
+        flow on the edge, the excess flow is displaced and re-routed on the next call of process.
+        :param u: Tail of the edge.
+        :param v: Head of the edge.
+        :param capacity: Capacity of the edge.
+        :return: None
+        """
+        self.add_node(u)
+        self.add_node(v)
+
+        if v not in self._capacity[u]:
+            self._capacity[u][v] = self._flow[u][v] = 0
+            self._capacity[v][u] = self._flow[v][u] = 0
+
+        self._record(u, v)
+        self._capacity[u][v] = capacity
+        self._successors[u].add(v)
+
+        displaced_flow = self._flow[u][v] - capacity
+
+        if displaced_flow > 0:
+            self._add_flow(u, v, -displaced_flow)
+            self._add_excess(u, displaced_flow)
+            self._add_excess(v, -displaced_flow)
+
+    def remove_edge(self, u: Any, v: Any) -> None:
+        """
+        Removes an edge from the network, the flow going through the edge is displaced.
+        :param u: Tail of the edge.
+        :param v: Head of the edge.
+        :return: None
+        """
+        self.add_edge(u, v, 0)
+        self._successors[u].remove(v)
+
+    def checkpoint(self) -> None:
+        """
+        Starts recording the changes of the network, so that they can be rolled back later.
+        :return: None
+        """
+        self._journal = []
+        self._journal_state = (self.flow_value, dict(self._excess), self._terminals)
+
+    def commit(self) -> None:
+        """
+        Stops recording the changes of the network and keeps them.
+        :return: None
+        """
+        self._journal = None
+        self._journal_state = None
+
+    def rollback(self) -> None:
+        """
+        Reverts the network to the state it had at the last checkpoint.
+        :return: None
+        """
+        journal, self._journal = self._journal, None
+
+        for u, v, capacity, flow, is_edge in reversed(journal):
+            self._capacity[u][v] = capacity
+            self._flow[u][v] = flow
+            self._flow[v][u] = -flow
+
+            if is_edge is True:
+                self._successors[u].add(v)
+            else:
+                self._successors[u].discard(v)
+
+        self.flow_value, self._excess, self._terminals = self._journal_state
+        self._journal_state = None
+
+    def _find_path(self, source: Any, target: Any, avoid: Optional[Any] = None) -> Optional[List[Any]]:
+        parents = {source: None}
+        queue = deque([source])
+
+        while queue:
+            u = queue.popleft()
+            flow_u = self._flow[u]
+
+            for v, capacity in self._capacity[u].items():
+                if v in parents or v == avoid or capacity - flow_u[v] <= 0:
+                    continue
+
+                parents[v] = u
+
+                if v == target:
+                    path = [v]
+                    while parents[path[-1]] is not None:
+                        path.append(parents[path[-1]])
+                    return path[::-1]
+
+                queue.append(v)
+
+        return None
+
+    def _push(self, source: Any, target: Any, amount: int, avoid: Optional[Any] = None) -> int:
+        pushed = 0
+
+        while pushed < amount:
+            path = self._find_path(source, target, avoid)
+
+            if path is None:
+                break
+
+            a = amount - pushed
+            for u, v in zip(path, path[1:]):
+                a = min(a, self._capacity[u][v] - self._flow[u][v])
+            for u, v in zip(path, path[1:]):
+                self._add_flow(u, v, a)
+
+            pushed += a
+
+        return pushed
+
+    def _compute_levels(self, s: Any, t: Any) -> Dict[Any, int]:
+        levels = {s: 0}
+        queue = deque([s])
+
+        while queue:
+            u = queue.popleft()
+            if u == t:
+                continue
+
+            flow_u = self._flow[u]
+
+            for v, capacity in self._capacity[u].items():
+                if v not in levels and capacity - flow_u[v] > 0:
+                    levels[v] = levels[u] + 1
+                    queue.append(v)
+
+        return levels
+
+    def _augment(self, s: Any, t: Any) -> int:
+        total = 0
+
+        while True:
+            levels = self._compute_levels(s, t)
+
+            if t not in levels:
+                return total
+
+            neighbours = {u: list(self._capacity[u]) for u in levels}
+            pointers = dict.fromkeys(levels, 0)
+
+            while True:
+                path = [s]
+
+                while path and path[-1] != t:
+                    u = path[-1]
+
+                    while pointers[u] < len(neighbours[u]):
+                        v = neighbours[u][pointers[u]]
+                        if levels.get(v, -1) == levels[u] + 1 and self._capacity[u][v] - self._flow[u][v] > 0:
+                            break
+                        pointers[u] += 1
+
+                    if pointers[u] < len(neighbours[u]):
+                        path.append(neighbours[u][pointers[u]])
+                        continue
+
+                    path.pop()
+                    if path:
+                        pointers[path[-1]] += 1
+
+                if not path:
+                    break
+
+                a = min(self._capacity[u][v] - self._flow[u][v] for u, v in zip(path, path[1:]))
+                for u, v in zip(path, path[1:]):
+                    self._add_flow(u, v, a)
+
+                total += a
+
+    def _reset(self) -> None:
+        for u in self._flow:
+            for v, flow in self._flow[u].items():
+                if flow > 0:
+                    self._add_flow(u, v, -flow)
+
+        self._excess = {}
+        self.flow_value = 0
+
+    def _repair(self, s: Any, t: Any) -> bool:
+        self.flow_value += self._excess.pop(t, 0)
+        self._excess.pop(s, None)
+
+        for u, excess in list(self._excess.items()):
+            if excess < 0:
+                pushed = self._push(t, u, -excess, avoid=s)
+                self.flow_value -= pushed
+                self._add_excess(u, pushed)
+
+        for u, excess in list(self._excess.items()):
+            if excess > 0:
+                pushed = self._push(u, t, excess, avoid=s)
+                self.flow_value += pushed
+                pushed += self._push(u, s, excess - pushed, avoid=t)
+                self._add_excess(u, -pushed)
+
+        return len(self._excess) == 0
+
+    def process(self, s: Any, t: Any) -> int:
+        """
+        Computes the maximum flow from source to sink starting from the flow computed during the previous call.
+        :param s: Source of the network.
+        :param t: Sink of the network.
+        :return: Maximum flow value.
+        """
+        self.add_node(s)
+        self.add_node(t)
+
+        if self._terminals != (s, t):
+            self._reset()
+            self._terminals = (s, t)
+
+        if self._repair(s, t) is False:
+            self._reset()
+
+        self.flow_value += self._augment(s, t)
+
+        return self.flow_value
+
+    def flow_dict(self) -> Dict[Any, Dict[Any, int]]:
+        """
+        Gets the current flow in the format of the networkx maximum_flow function.
+        :return: Dictionary mapping every edge of the network to the flow going through it.
+        """
+        return {
+            u: {v: max(self._flow[u][v], 0) for v in successors} for u, successors in self._successors.items()
+        }
@@ -1,118 +1,307 @@
 # -*- coding: utf-8 -*-
-from copy import deepcopy
+from collections import deque
 from networkx import Graph
-from typing import Any, Dict, Optional, Set, Tuple
-from queue import Queue
+from numpy import array, int64, ndarray
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from utils.array_flow_network import ArrayFlowNetwork
 
 
 class EdmondsBlossomMatching(object):
     """
     The implementation of the Edmonds' Blossom Algorithm for finding maximum matching on arbitrary graphs that is based
-    on C++ implementation available at https://e-maxx.ru/algo/matching_edmonds. The running complexity of this
-    particular implementation is O(V^3).
+    on C++ implementation available at https://e-maxx.ru/algo/matching_edmonds. The nodes are relabelled to integers,
+    so the search state is kept in lists that are allocated once and reset only where a search touched them. The bases
+    of the contracted blossoms are kept in a union-find structure, and the nodes of an alternating tree that contains no
+    augmenting path are excluded from the subsequent searches. The running complexity of this particular implementation
+    is O(VE * log(V)).
     """
 
     @staticmethod
+    def _find_base(bases: List[int], v: int) -> int:
+        root = v
+        while bases[root] != root:
+            root = bases[root]
+
+        while bases[v] != root:
+            bases[v], v = root, bases[v]
+
+        return root
+
+    @classmethod
     def _mark_path(
-            v: Any,
-            b: Any,
-            child: Any,
-            blossom: Set[Any],
-            base: Dict[Any, Any],
-            matching: Dict[Any, Any],
-            p: Dict[Any, Any],
+            cls,
+            v: int,
+            b: int,
+            child: int,
+            blossom: List[int],
+            bases: List[int],
+            matching: List[int],
+            p: List[int],
     ) -> None:
-        while base[v] != b:
-            blossom.add(base[v])
-            blossom.add(base[matching[v]])
+        while cls._find_base(bases, v) != b:
+            blossom.append(v)
+            blossom.append(matching[v])
             p[v] = child
             child = matching[v]
             v = p[matching[v]]
 
-    @staticmethod
+    @classmethod
     def _find_lowest_common_ancestor(
-            a: Any,
-            b: Any,
-            base: Dict[Any, Any],
-            matching: Dict[Any, Any],
-            p: Dict[Any, Any],
-    ) -> Any:
-        used = set()
+            cls,
+            a: int,
+            b: int,
+            bases: List[int],
+            matching: List[int],
+            p: List[int],
+            marks: List[bool],
+    ) -> int:
+        path = []
 
         while True:
-            a = base[a]
-            used.add(a)
-            if matching.get(a, None) is None:
+            a = cls._find_base(bases, a)
+            marks[a] = True
+            path.append(a)
+            if matching[a] == -1:
                 break
             a = p[matching[a]]
 
         while True:
-            b = base[b]
-            if b in used:
-                return b
+            b = cls._find_base(bases, b)
+            if marks[b] is True:
+                break
             b = p[matching[b]]
 
-    @staticmethod
-    def _find_path(root: Any, g: Graph, matching: Dict[Any, Any]) -> Tuple[Dict[Any, Any], Optional[Any]]:
-        used = set()
-        p = {}
-        base = {u: u for u in g.nodes}
+        for a in path:
+            marks[a] = False
+
+        return b
+
+    @classmethod
+    def _find_path(
+            cls,
+            root: int,
+            adjacency: List[List[int]],
+            matching: List[int],
+            p: List[int],
+            bases: List[int],
+            used: List[bool],
+            excluded: List[bool],
+            marks: List[bool],
+            touched: List[int],
+    ) -> int:
+        used[root] = True
+        touched.append(root)
+        q = deque([root])
+
+        while q:
+            v = q.popleft()
+
+            for to in adjacency[v]:
+                if excluded[to] is True or matching[v] == to:
+                    continue
+
+                v_base = cls._find_base(bases, v)
+                if v_base == cls._find_base(bases, to):
+                    continue
 
-        used.add(root)
-        q = Queue()
-        q.put(root)
+                if to == root or matching[to] != -1 and p[matching[to]] != -1:
+                    curbase = cls._find_lowest_common_ancestor(v, to, bases, matching, p, marks)
 
-        while not q.empty():
-            v = q.get()
+                    blossom = []
+                    cls._mark_path(v, curbase, to, blossom, bases, matching, p)
+                    cls._mark_path(to, curbase, v, blossom, bases, matching, p)
 
-            for to in g[v]:
-                if base[v] == base[to] or matching.get(v, None) == to:
-                    continue
-                if to == root or matching.get(to, None) is not None and p.get(matching[to], None) is not None:
-                    curbase = EdmondsBlossomMatching._find_lowest_common_ancestor(v, to, base, matching, p)
-
-                    blossom = set()
-                    EdmondsBlossomMatching._mark_path(v, curbase, to, blossom, base, matching, p)
-                    EdmondsBlossomMatching._mark_path(to, curbase, v, blossom, base, matching, p)
-
-                    for u in g.nodes:
-                        if base[u] in blossom:
-                            base[u] = curbase
-                            if u not in used:
-                                used.add(u)
-                                q.put(u)
-                elif p.get(to, None) is None:
+                    for u in blossom:
+                        u_base = cls._find_base(bases, u)
+                        if u_base != curbase:
+                            bases[u_base] = curbase
+
+                        if used[u] is False:
+                            used[u] = True
+                            q.append(u)
+                elif p[to] == -1:
                     p[to] = v
+                    touched.append(to)
 
-                    if matching.get(to, None) is None:
-                        return p, to
+                    if matching[to] == -1:
+                        return to
 
                     to = matching[to]
-                    used.add(to)
-                    q.put(to)
+                    used[to] = True
+                    touched.append(to)
+                    q.append(to)
 
-        return p, None
+        return -1
 
-    @staticmethod
-    def process(g: Graph, initial_matching: Optional[Dict[Any, Any]] = None) -> Dict[Any, Any]:
+    @classmethod
+    def process_adjacency(cls, adjacency: List[List[int]], matching: List[int]) -> List[int]:
+        """
+        Computes the maximum matching of a graph with nodes 0, ..., V - 1.
+        :param adjacency: Neighbours of every node.
+        :param matching: Initial matching to extend, the matched node of every node or -1, updated in place.
+        :return: Computed matching in the same format.
+        """
+        p = [-1] * len(adjacency)
+        bases = list(range(len(adjacency)))
+        used = [False] * len(adjacency)
+        excluded = [False] * len(adjacency)
+        marks = [False] * len(adjacency)
+
+        for u in range(len(adjacency)):
+            if matching[u] != -1 or excluded[u] is True:
+                continue
+
+            touched = []
+            v = cls._find_path(u, adjacency, matching, p, bases, used, excluded, marks, touched)
+
+            if v == -1:
+                # The alternating tree is Hungarian, none of its nodes can be a part of an augmenting path later on.
+                for w in touched:
+                    excluded[w] = True
+
+            while v != -1:
+                pv = p[v]
+                ppv = matching[pv]
+                matching[v] = pv
+                matching[pv] = v
+                v = ppv
+
+            for w in touched:
+                p[w] = -1
+                bases[w] = w
+                used[w] = False
+
+        return matching
+
+    @classmethod
+    def process(cls, g: Graph, initial_matching: Optional[Dict[Any, Any]] = None) -> Dict[Any, Any]:
         """
         Computes the maximum matching.
         :param g: The input graph.
         :param initial_matching: Initial matching to extend, considered empty if none is provided.
         :return: Computed matching.
         """
-        matching = {} if initial_matching is None else deepcopy(initial_matching)
+        nodes = list(g.nodes)
+        node_to_idx = {u: k for k, u in enumerate(nodes)}
+        adjacency = [[node_to_idx[v] for v in g[u]] for u in nodes]
 
-        for u in g.nodes:
-            if matching.get(u, None) is None:
-                p, v = EdmondsBlossomMatching._find_path(u, g, matching)
+        matching = [-1] * len(nodes)
+        if initial_matching is not None:
+            for u, v in initial_matching.items():
+                if v is not None and u in node_to_idx and v in node_to_idx:
+                    matching[node_to_idx[u]] = node_to_idx[v]
 
-                while v is not None:
-                    pv = p[v]
-                    ppv = matching.get(pv, None)
-                    matching[v] = pv
-                    matching[pv] = v
-                    v = ppv
+        matching = cls.process_adjacency(adjacency, matching)
+
+        return {nodes[u]: nodes[v] for u, v in enumerate(matching) if v != -1}
+
+
+class HopcroftKarpMatching(object):
+    """
+    The implementation of the Hopcroft-Karp Algorithm for finding maximum matching on bipartite graphs developed in "An
+    n^(5/2) algorithm for maximum matchings in bipartite graphs" (Hopcroft and Karp, 1973). Every phase finds a maximal
+    set of shortest vertex-disjoint augmenting paths, so the running complexity is O(E * sqrt(V)).
+    """
+
+    @staticmethod
+    def _compute_levels(adjacency: List[List[int]], matching_left: List[int], matching_right: List[int]) -> List[int]:
+        levels = [-1] * len(adjacency)
+        q = deque()
+
+        for u in range(len(adjacency)):
+            if matching_left[u] == -1:
+                levels[u] = 0
+                q.append(u)
+
+        limit = -1
+
+        while q:
+            u = q.popleft()
+            if limit != -1 and levels[u] >= limit:
+                continue
+
+            for v in adjacency[u]:
+                w = matching_right[v]
+                if w == -1:
+                    limit = levels[u] + 1
+                elif levels[w] == -1:
+                    levels[w] = levels[u] + 1
+                    q.append(w)
+
+        return levels if limit != -1 else None
+
+    @staticmethod
+    def _augment(
+            root: int,
+            adjacency: List[List[int]],
+            matching_left: List[int],
+            matching_right: List[int],
+            levels: List[int],
+            pointers: List[int],
+    ) -> bool:
+        stack = [root]
+        path = []
+
+        while stack:
+            u = stack[-1]
+
+            if pointers[u] == len(adjacency[u]):
+                levels[u] = -1
+                stack.pop()
+                if path:
+                    path.pop()
+                continue
+
+            v = adjacency[u][pointers[u]]
+            pointers[u] += 1
+            w = matching_right[v]
+
+            if w == -1:
+                path.append(v)
+                for u, v in zip(stack, path):
+                    matching_left[u] = v
+                    matching_right[v] = u
+                return True
+
+            if levels[w] == levels[u] + 1:
+                stack.append(w)
+                path.append(v)
+
+        return False
+
+    @classmethod
+    def process(cls, g: Graph, left: Iterable[Any]) -> Dict[Any, Any]:
+        """
+        Computes the maximum matching.
+        :param g: The input bipartite graph.
+        :param left: Nodes of one side of the graph, nodes that are not in the graph are ignored.
+        :return: Computed matching.
+        """
+        left = [u for u in left if u in g]
+        left_to_idx = {u: k for k, u in enumerate(left)}
+        right = [u for u in g.nodes if u not in left_to_idx]
+        right_to_idx = {u: k for k, u in enumerate(right)}
+        adjacency = [[right_to_idx[v] for v in g[u]] for u in left]
+
+        matching_left = [-1] * len(left)
+        matching_right = [-1] * len(right)
+
+        while True:
+            levels = cls._compute_levels(adjacency, matching_left, matching_right)
+            if levels is None:
+                break
+
+            pointers = [0] * len(left)
+            for u in range(len(left)):
+                if matching_left[u] == -1:
+                    cls._augment(u, adjacency, matching_left, matching_right, levels, pointers)
+
+        matching = {}
+        for u, v in enumerate(matching_left):
+            if v != -1:
+                matching[left[u]] = right[v]
+                matching[right[v]] = left[u]
 
         return matching
 
@@ -121,97 +310,199 @@ class UpperDegreeConstrainedSubgraph(object):
     """
     An algorithm for solving the upper degree constrained subgraph problem based on "Another look at the degree
     constrained subgraph problem" (Shiloach, 1981) that reduces the problem to ordinary matchings on general graphs.
+    The vertices of the helper graph are numbered densely: the copies of the nodes come first, ordered by node, followed
+    by the pair of vertices of every edge, ordered by edge.
     """
 
     @staticmethod
-    def construct_h(g: Graph, constraints: Dict[int, int]) -> Graph:
+    def construct_h(
+            number_of_nodes: int,
+            tails: Sequence[int],
+            heads: Sequence[int],
+            constraints: Sequence[int],
+    ) -> Tuple[List[List[int]], List[int]]:
         """
         Construct helper graph.
-        :param g: Original graph.
-        :param constraints: Degree constrains.
-        :return: Resulting helper graph.
+        :param number_of_nodes: Number of nodes of the original graph.
+        :param tails: First node of every edge.
+        :param heads: Second node of every edge.
+        :param constraints: Degree constraint of every node.
+        :return: Adjacency of the helper graph and the index of the first copy of every node.
         """
-        h = Graph()
+        offsets = [0] * (number_of_nodes + 1)
+        for u in range(number_of_nodes):
+            offsets[u + 1] = offsets[u] + constraints[u]
 
-        for u in g.nodes:
-            for i in range(constraints[u]):
-                h.add_node("v_%s^%d" % (u, i))
+        adjacency = [[] for _ in range(offsets[-1] + 2 * len(tails))]
 
-        for i, e in enumerate(g.edges):
-            u, v = e
+        for e, (u, v) in enumerate(zip(tails, heads)):
+            x = offsets[-1] + 2 * e
+            y = x + 1
 
-            h.add_node("u_{%s, %s}" % (u, v))
-            h.add_node("w_{%s, %s}" % (u, v))
-            h.add_edge("u_{%s, %s}" % (u, v), "w_{%s, %s}" % (u, v))
+            adjacency[x].append(y)
+            adjacency[y].append(x)
 
-            for j in range(constraints[u]):
-                h.add_edge("u_{%s, %s}" % (u, v), "v_%s^%d" % (u, j))
-            for j in range(constraints[v]):
-                h.add_edge("w_{%s, %s}" % (u, v), "v_%s^%d" % (v, j))
+            for j in range(offsets[u], offsets[u + 1]):
+                adjacency[x].append(j)
+                adjacency[j].append(x)
+            for j in range(offsets[v], offsets[v + 1]):
+                adjacency[y].append(j)
+                adjacency[j].append(y)
 
-        return h
+        return adjacency, offsets
+
+    @staticmethod
+    def construct_matching(
+            tails: Sequence[int],
+            heads: Sequence[int],
+            offsets: List[int],
+            selected_edges: Iterable[int],
+    ) -> List[int]:
+        """
+        Construct the matching of the helper graph that corresponds to a DCS solution.
+        :param tails: First node of every edge.
+        :param heads: Second node of every edge.
+        :param offsets: Index of the first copy of every node in the helper graph.
+        :param selected_edges: Indices of the edges in the DCS solution.
+        :return: Matched vertex of every vertex of the helper graph or -1.
+        """
+        matching = [-1] * (offsets[-1] + 2 * len(tails))
+        free_copies = offsets[:-1]
+
+        for e in range(len(tails)):
+            x = offsets[-1] + 2 * e
+            matching[x], matching[x + 1] = x + 1, x
+
+        for e in selected_edges:
+            u, v = tails[e], heads[e]
+            if free_copies[u] == offsets[u + 1] or free_copies[v] == offsets[v + 1]:
+                continue
+
+            x = offsets[-1] + 2 * e
+            matching[x], matching[free_copies[u]] = free_copies[u], x
+            matching[x + 1], matching[free_copies[v]] = free_copies[v], x + 1
+
+            free_copies[u] += 1
+            free_copies[v] += 1
+
+        return matching
 
     @staticmethod
-    def construct_dcs(g: Graph, matching: Dict[Any, Any]) -> Dict[Any, Set[Any]]:
+    def construct_dcs(number_of_edges: int, offsets: List[int], matching: List[int]) -> ndarray:
         """
         Construct the DCS solution from matching.
-        :param g: Corresponding graph.
+        :param number_of_edges: Number of edges of the original graph.
+        :param offsets: Index of the first copy of every node in the helper graph.
         :param matching: Matching solution.
-        :return: DCS solution.
+        :return: Indices of the edges in the DCS solution.
         """
-        degree_constrained_subgraph = {}
-        for u in g.nodes:
-            degree_constrained_subgraph[u] = set()
+        number_of_copies = offsets[-1]
+
+        # An edge is in the solution iff both of its vertices are matched to the copies of its nodes.
+        selected = [
+            e for e in range(number_of_edges)
+            if 0 <= matching[number_of_copies + 2 * e] < number_of_copies
+            and 0 <= matching[number_of_copies + 2 * e + 1] < number_of_copies
+        ]
+
+        return array(selected, dtype=int64)
+
+    @classmethod
+    def process_arrays(
+            cls,
+            number_of_nodes: int,
+            tails: Sequence[int],
+            heads: Sequence[int],
+            constraints: Sequence[int],
+            selected_edges: Optional[Iterable[int]] = None,
+    ) -> ndarray:
+        """
+        Process the input given as index arrays using Edmonds' Blossom Algorithm.
+        :param number_of_nodes: Number of nodes, the nodes are 0, ..., number_of_nodes - 1.
+        :param tails: First node of every edge.
+        :param heads: Second node of every edge.
+        :param constraints: Degree constraint of every node.
+        :param selected_edges: Indices of the edges of an initial DCS solution to extend, considered empty if none is
+        provided.
+        :return: Indices of the edges in the DCS solution.
+        """
+        adjacency, offsets = cls.construct_h(number_of_nodes, tails, heads, constraints)
+        matching = cls.construct_matching(tails, heads, offsets, [] if selected_edges is None else selected_edges)
 
-        for i, e in enumerate(g.edges):
-            u, v = e
+        matching = EdmondsBlossomMatching.process_adjacency(adjacency, matching)
 
-            if (
-                    matching.get("u_{%s, %s}" % (u, v), '').startswith("v_") and
-                    matching.get("w_{%s, %s}" % (u, v), '').startswith("v_")
-            ):
-                degree_constrained_subgraph[u].add(v)
-                degree_constrained_subgraph[v].add(u)
+        return cls.construct_dcs(len(tails), offsets, matching)
+
+    @staticmethod
+    def process_bipartite(g: Graph, constraints: Dict[Any, int], left: Iterable[Any]) -> Dict[Any, Set[Any]]:
+        """
+        Process a bipartite input as a maximum flow, where every node can carry at most its degree constraint.
+        :param g: Bipartite graph to process.
+        :param constraints: Degree constraints.
+        :param left: Nodes of one side of the graph, nodes that are not in the graph are ignored.
+        :return: Resulting solution.
+        """
+        nodes = list(g.nodes)
+        left = {u for u in left if u in g}
+        node_to_idx = {u: 1 + k for k, u in enumerate(nodes)}
+        sink = len(nodes) + 1
+
+        network = ArrayFlowNetwork()
+        network.add_node(sink)
+
+        for u in nodes:
+            if u in left:
+                network.add_edge(0, node_to_idx[u], constraints[u])
+                for v in g[u]:
+                    network.add_edge(node_to_idx[u], node_to_idx[v], 1)
+            else:
+                network.add_edge(node_to_idx[u], sink, constraints[u])
+
+        network.process(0, sink)
+        flow_dict = network.flow_dict()
+
+        degree_constrained_subgraph = {u: set() for u in nodes}
+        for u in left:
+            for v in g[u]:
+                if flow_dict[node_to_idx[u]][node_to_idx[v]] > 0:
+                    degree_constrained_subgraph[u].add(v)
+                    degree_constrained_subgraph[v].add(u)
 
         return degree_constrained_subgraph
 
-    @staticmethod
-    def process(g: Graph, constraints: Dict[int, int]) -> Dict[Any, Set[Any]]:
+    @classmethod
+    def process(
+            cls,
+            g: Graph,
+            constraints: Dict[Any, int],
+            initial_dcs: Optional[Dict[Any, Set[Any]]] = None,
+    ) -> Dict[Any, Set[Any]]:
         """
         Process the input using Edmonds' Blossom Algorithm.
         :param g: Graph to process.
         :param constraints: Degree constraints.
+        :param initial_dcs: Initial DCS solution to extend, considered empty if none is provided.
         :return: Resulting solution.
         """
-        h = Graph()
-
-        for u in g.nodes:
-            for i in range(constraints[u]):
-                h.add_node("v_%s^%d" % (u, i))
-
-        for i, e in enumerate(g.edges):
-            u, v = e
-
-            h.add_node("u_%d" % i)
-            h.add_node("w_%d" % i)
-            h.add_edge("u_%d" % i, "w_%d" % i)
-
-            for j in range(constraints[u]):
-                h.add_edge("u_%d" % i, "v_%s^%d" % (u, j))
-            for j in range(constraints[v]):
-                h.add_edge("w_%d" % i, "v_%s^%d" % (v, j))
-
-        matching = EdmondsBlossomMatching().process(h)
-
-        degree_constrained_subgraph = {}
-        for u in g.nodes:
-            degree_constrained_subgraph[u] = set()
-
-        for i, e in enumerate(g.edges):
-            u, v = e
-
-            if matching.get("u_%d" % i, '').startswith("v_") and matching.get("w_%d" % i, '').startswith("v_"):
-                degree_constrained_subgraph[u].add(v)
-                degree_constrained_subgraph[v].add(u)
+        nodes = list(g.nodes)
+        node_to_idx = {u: k for k, u in enumerate(nodes)}
+        edges = list(g.edges)
+
+        tails = [node_to_idx[u] for u, _ in edges]
+        heads = [node_to_idx[v] for _, v in edges]
+
+        selected_edges = None
+        if initial_dcs is not None:
+            selected_edges = [e for e, (u, v) in enumerate(edges) if v in initial_dcs.get(u, ())]
+
+        selected_edges = cls.process_arrays(
+            len(nodes), tails, heads, [constraints[u] for u in nodes], selected_edges,
+        )
+
+        degree_constrained_subgraph = {u: set() for u in nodes}
+        for e in selected_edges.tolist():
+            u, v = edges[e]
+            degree_constrained_subgraph[u].add(v)
+            degree_constrained_subgraph[v].add(u)
 
         return degree_constrained_subgraph